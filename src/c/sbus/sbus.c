@@ -28,6 +28,7 @@
 #include <unistd.h>
 #include <stdio.h>
 #include <stdarg.h>
+#include <poll.h>
 
 
 #include "sbus.h"
@@ -35,6 +36,7 @@
 #define SBUS_SYSLOG_PATH  "sbus"
 #define MAX_FDS           4096
 #define MAX_MSG_LENGTH    4096
+#define SESSION_BACKLOG   128
 
 
 /*----------------------------------------------------------------------------
@@ -210,6 +212,93 @@ int sbus_listen( int n_sbus_handle, float f_timeout )
     return n_status;
 }
 
+/*=========================== SESSIONS =====================================*/
+
+int sbus_create_session( const char* str_session_path )
+{
+    int n_listen_handle = socket( PF_UNIX, SOCK_SEQPACKET, 0 );
+    if( n_listen_handle < 0 )
+    {
+        syslog( LOG_ERR,
+                "sbus_create_session: Failed to create a socket. %s",
+                strerror( errno ) );
+        return -1;
+    }
+
+    struct sockaddr_un sockaddr;
+    memset( &sockaddr, 0, sizeof(sockaddr) );
+    sockaddr.sun_family = AF_UNIX;
+    strncpy( sockaddr.sun_path,
+             str_session_path,
+             sizeof( sockaddr.sun_path ) );
+    sockaddr.sun_path[sizeof(sockaddr.sun_path)-1] = 0;
+    unlink( sockaddr.sun_path );
+
+    if( 0 != bind( n_listen_handle,
+                   (struct sockaddr *) &sockaddr,
+                   sizeof(sockaddr) ) ||
+        0 != chmod( str_session_path, 0777 ) ||
+        0 != listen( n_listen_handle, SESSION_BACKLOG ) )
+    {
+        syslog( LOG_ERR,
+                "sbus_create_session: Failed to listen on %s. %s",
+                str_session_path, strerror(errno) );
+        close( n_listen_handle );
+        return -1;
+    }
+
+    syslog( LOG_DEBUG,
+            "sbus_create_session: Listening at - %s", str_session_path );
+    return n_listen_handle;
+}
+
+int sbus_accept_session( int n_listen_handle )
+{
+    int n_session_handle = accept( n_listen_handle, NULL, NULL );
+    if( n_session_handle < 0 )
+        syslog( LOG_ERR,
+                "sbus_accept_session: Failed to accept session. %s",
+                strerror(errno) );
+    return n_session_handle;
+}
+
+int sbus_poll( const int* p_handles,
+               int        n_handles,
+               float      f_timeout,
+               int*       p_ready )
+{
+    struct pollfd* p_fds =
+        (struct pollfd*) malloc( n_handles * sizeof(struct pollfd) );
+    if( NULL == p_fds )
+        return -1;
+
+    int i;
+    for( i = 0; i < n_handles; ++i )
+    {
+        p_fds[i].fd = p_handles[i];
+        p_fds[i].events = POLLIN;
+        p_fds[i].revents = 0;
+    }
+
+    int n_timeout_ms = f_timeout > 0.0 ? (int) (f_timeout * 1000) : -1;
+    int n_status = poll( p_fds, n_handles, n_timeout_ms );
+    if( n_status < 0 )
+        syslog( LOG_ERR,
+                "sbus_poll: Poll returned unexpectedly. %s",
+                strerror(errno) );
+    else
+        for( i = 0; i < n_handles; ++i )
+            p_ready[i] = ( 0 != p_fds[i].revents ) ? 1 : 0;
+
+    free( p_fds );
+    return n_status;
+}
+
+void sbus_close( int n_sbus_handle )
+{
+    close( n_sbus_handle );
+}
+
 
 /*=========================== MESSAGE SENDING ==============================*/
 
@@ -374,6 +463,33 @@ int sbus_send_msg( const char* str_sbus_path,
     return n_status;
 }
 
+/*----------------------------------------------------------------------------
+ * sbus_send_session_msg
+ * sends a message without file descriptors over a connected session
+ */
+int sbus_send_session_msg( int n_session_handle,
+                           const char* str_msg_data,
+                           int n_msg_len )
+{
+    char* p_bytestream = NULL;
+    int n_bytestream_len = dump_data_to_bytestream( &p_bytestream,
+                                                    0, "", 0,
+                                                    str_msg_data,
+                                                    n_msg_len );
+    if( n_bytestream_len < 0 )
+        return -1;
+
+    // MSG_DONTWAIT not to get stuck with a client which stops reading
+    int n_status = send( n_session_handle, p_bytestream, n_bytestream_len,
+                         MSG_DONTWAIT | MSG_NOSIGNAL );
+    if( 0 > n_status )
+        syslog( LOG_ERR,
+                "sbus_send_session_msg: Failed to send message. %s",
+                strerror(errno) );
+    free( p_bytestream );
+    return n_status;
+}
+
 
 /*=========================== MESSAGE RECEIVING ============================*/
 
@@ -490,6 +606,11 @@ int sbus_recv_msg( int n_sbus_handler,
         syslog(LOG_ERR, "sbus_recv_msg: recvmsg failed. %s", strerror(errno));
         close(n_sbus_handler);
         n_status = -1;
+    } else if( n_msg_len < (int) (3 * sizeof(int)) ) {
+        // Zero length means that the peer closed the session
+        syslog(LOG_DEBUG, "sbus_recv_msg: Got %d bytes. Closing", n_msg_len);
+        close(n_sbus_handler);
+        n_status = -1;
     }
 
     if( 0 <= n_status ) {
@@ -39,6 +39,45 @@ extern int sbus_create( const char* str_sbus_path );
  */
 extern int sbus_listen( int n_sbus_handle , float f_timeout);
 
+/*----------------------------------------------------------------------------
+ * sbus_create_session
+ * create a SOCK_SEQPACKET socket listening for persistent sessions
+ * returns -1 on error, listening handler on success
+ */
+extern int sbus_create_session( const char* str_session_path );
+
+/*----------------------------------------------------------------------------
+ * sbus_accept_session
+ * accept a session on the listening handler
+ * returns -1 on error, session handler on success
+ */
+extern int sbus_accept_session( int n_listen_handle );
+
+/*----------------------------------------------------------------------------
+ * sbus_poll
+ * Suspend until any of the given handlers gets readable
+ * p_ready is filled with 1 for readable handlers and 0 for the others
+ * returns -1 on error, 0 on timeout, number of readable handlers on success
+ */
+extern int sbus_poll( const int* p_handles,
+                      int        n_handles,
+                      float      f_timeout,
+                      int*       p_ready );
+
+/*----------------------------------------------------------------------------
+ * sbus_send_session_msg
+ * sends a message without file descriptors over a connected session
+ */
+extern int sbus_send_session_msg( int         n_session_handle,
+                                  const char* str_msg_data,
+                                  int         n_msg_len );
+
+/*----------------------------------------------------------------------------
+ * sbus_close
+ * close the handler
+ */
+extern void sbus_close( int n_sbus_handle );
+
 /*----------------------------------------------------------------------------
  * sbus_recv_msg
  * reads the data, allocates memory for the necessary buffers
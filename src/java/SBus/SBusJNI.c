@@ -168,6 +168,109 @@ Java_org_openstack_storlet_sbus_SBusJNI_listenSBus(     JNIEnv* env,
     return sbus_listen( jnBus , jfTimeout );
 }
 
+/*----------------------------------------------------------------------------
+ *
+ * */
+JNIEXPORT jint JNICALL
+Java_org_openstack_storlet_sbus_SBusJNI_createSession(  JNIEnv* env,
+                                                        jobject obj,
+                                                        jstring jstrPath )
+{
+    int nListen = -1;
+    const char* pPath = (*env)->GetStringUTFChars( env, jstrPath, NULL );
+    if( NULL == pPath )
+        return -1;
+
+    nListen = sbus_create_session( pPath );
+
+    (*env)->ReleaseStringUTFChars( env, jstrPath, pPath );
+    return nListen;
+}
+
+/*----------------------------------------------------------------------------
+ *
+ * */
+JNIEXPORT jint JNICALL
+Java_org_openstack_storlet_sbus_SBusJNI_acceptSession(  JNIEnv* env,
+                                                        jobject obj,
+                                                        jint    jnListen )
+{
+    return sbus_accept_session( jnListen );
+}
+
+/*----------------------------------------------------------------------------
+ * Returns the array of readable handlers, which is empty on timeout,
+ * or NULL on error
+ * */
+JNIEXPORT jintArray JNICALL
+Java_org_openstack_storlet_sbus_SBusJNI_pollSBus(   JNIEnv*   env,
+                                                    jobject   obj,
+                                                    jintArray jnBuses,
+                                                    jfloat    jfTimeout )
+{
+    int i, j;
+    jsize nBuses = (*env)->GetArrayLength( env, jnBuses );
+    jint* pBuses = (*env)->GetIntArrayElements( env, jnBuses, NULL );
+    if( NULL == pBuses )
+        return NULL;
+
+    int* pHandles = (int*) malloc( nBuses * sizeof(int) );
+    int* pReady = (int*) malloc( nBuses * sizeof(int) );
+    for( i = 0; i < nBuses; ++i )
+        pHandles[i] = pBuses[i];
+    (*env)->ReleaseIntArrayElements( env, jnBuses, pBuses, JNI_ABORT );
+
+    jintArray jReady = NULL;
+    int nStatus = sbus_poll( pHandles, nBuses, jfTimeout, pReady );
+    if( 0 <= nStatus )
+    {
+        jReady = (*env)->NewIntArray( env, nStatus );
+        if( NULL != jReady )
+        {
+            jint* pReadyBuses = (jint*) malloc( nStatus * sizeof(jint) );
+            for( i = 0, j = 0; i < nBuses && j < nStatus; ++i )
+                if( pReady[i] )
+                    pReadyBuses[j++] = pHandles[i];
+            (*env)->SetIntArrayRegion( env, jReady, 0, j, pReadyBuses );
+            free( pReadyBuses );
+        }
+    }
+
+    free( pHandles );
+    free( pReady );
+    return jReady;
+}
+
+/*----------------------------------------------------------------------------
+ *
+ * */
+JNIEXPORT jint JNICALL
+Java_org_openstack_storlet_sbus_SBusJNI_sendSessionMessage( JNIEnv* env,
+                                                            jobject obj,
+                                                            jint    jnSession,
+                                                            jstring jstrMsg )
+{
+    const char* strMsg = (*env)->GetStringUTFChars( env, jstrMsg, NULL );
+    if( NULL == strMsg )
+        return -1;
+
+    int nStatus = sbus_send_session_msg( jnSession, strMsg, strlen( strMsg ) );
+
+    (*env)->ReleaseStringUTFChars( env, jstrMsg, strMsg );
+    return nStatus;
+}
+
+/*----------------------------------------------------------------------------
+ *
+ * */
+JNIEXPORT void JNICALL
+Java_org_openstack_storlet_sbus_SBusJNI_closeSBus(  JNIEnv* env,
+                                                    jobject obj,
+                                                    jint    jnBus )
+{
+    sbus_close( jnBus );
+}
+
 /*----------------------------------------------------------------------------
  *
  * */
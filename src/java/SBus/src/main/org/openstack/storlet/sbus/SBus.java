@@ -18,6 +18,9 @@
 package org.openstack.storlet.sbus;
 
 import java.io.IOException;
+import java.util.ArrayList;
+import java.util.HashMap;
+import java.util.List;
 import org.openstack.storlet.sbus.SBusBackend.eLogLevel;
 
 /*----------------------------------------------------------------------------
@@ -26,7 +29,17 @@ import org.openstack.storlet.sbus.SBusBackend.eLogLevel;
  * The front end Java class for SBus functionality.
  * */
 public class SBus {
+    /*
+     * Persistent sessions are accepted on the SOCK_SEQPACKET socket placed
+     * next to the datagram socket. This should be kept consistent with
+     * storlets/sbus/session.py
+     * */
+    public static final String SESSION_PATH_SUFFIX = ".session";
+
     private SBusHandler hServerSideSBus_;
+    private SBusHandler hSessionListener_ = null;
+    private HashMap<Integer, SBusHandler> sessions_ =
+        new HashMap<Integer, SBusHandler>();
     private SBusBackend SBusBack_;
     private String ContainerId_;
 
@@ -67,6 +80,104 @@ public class SBus {
         return Dtg;
     }
 
+    /*------------------------------------------------------------------------
+     * createSession
+     *
+     * Start accepting persistent sessions next to the server side SBus
+     * */
+    public void createSession(final String strPath) throws IOException {
+        hSessionListener_ = SBusBack_.createSession(strPath
+                + SESSION_PATH_SUFFIX);
+    }
+
+    /*------------------------------------------------------------------------
+     * poll
+     *
+     * Wait for requests on the SBus and the sessions. New sessions are
+     * accepted here. Returns the handlers which have requests to receive,
+     * which can be empty when only a new session is accepted.
+     * */
+    public List<SBusHandler> poll(final float fTimeout) throws IOException {
+        int[] nBuses = new int[2 + sessions_.size()];
+        nBuses[0] = hServerSideSBus_.getFD();
+        nBuses[1] = hSessionListener_.getFD();
+        int i = 2;
+        for (Integer nSession : sessions_.keySet()) {
+            nBuses[i++] = nSession;
+        }
+
+        int[] nReady = SBusBack_.pollSBus(nBuses, fTimeout);
+        if (0 == nReady.length)
+            throw new IOException("Timed out while listening to SBus");
+
+        List<SBusHandler> ready = new ArrayList<SBusHandler>();
+        for (int nBus : nReady) {
+            if (nBus == hServerSideSBus_.getFD()) {
+                ready.add(hServerSideSBus_);
+            } else if (nBus == hSessionListener_.getFD()) {
+                SBusHandler hSession = SBusBack_.acceptSession(
+                        hSessionListener_);
+                sessions_.put(hSession.getFD(), hSession);
+            } else {
+                ready.add(sessions_.get(nBus));
+            }
+        }
+        return ready;
+    }
+
+    /*------------------------------------------------------------------------
+     * receive
+     *
+     * Receive a request from the SBus or a session. Returns null when the
+     * session is closed by the client.
+     * */
+    public ServerSBusInDatagram receive(final SBusHandler hSBus)
+            throws Exception {
+        if (hSBus == hServerSideSBus_)
+            return receive();
+
+        SBusRawMessage Msg;
+        try {
+            Msg = SBusBack_.receiveRawMessage(hSBus);
+        } catch (IOException e) {
+            // The handler is already closed by the backend
+            sessions_.remove(hSBus.getFD());
+            return null;
+        }
+        ServerSBusInDatagram Dtg = new ServerSBusInDatagram(Msg);
+        if (null == Dtg.getRequestId()) {
+            closeSession(hSBus);
+            throw new IOException("Request id is missing in session request");
+        }
+        Dtg.setSessionOut(new SBusSessionOutputStream(this, hSBus,
+                Dtg.getRequestId()));
+        return Dtg;
+    }
+
+    /*------------------------------------------------------------------------
+     * sendSessionMessage
+     *
+     * Send a response over a session. The session is closed when it fails.
+     * */
+    public void sendSessionMessage(final SBusHandler hSession,
+            final String strMsg) throws IOException {
+        try {
+            SBusBack_.sendSessionMessage(hSession, strMsg);
+        } catch (IOException e) {
+            closeSession(hSession);
+            throw e;
+        }
+    }
+
+    public boolean isSession(final SBusHandler hSBus) {
+        return hSBus != hServerSideSBus_;
+    }
+
+    private void closeSession(final SBusHandler hSession) {
+        if (null != sessions_.remove(hSession.getFD()))
+            SBusBack_.closeSBus(hSession);
+    }
+
     /*------------------------------------------------------------------------
      * send
      * */
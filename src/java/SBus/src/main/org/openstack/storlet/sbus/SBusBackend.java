@@ -112,4 +112,57 @@ public class SBusBackend {
         return Msg;
     }
 
+    /*------------------------------------------------------------------------
+     * Create the socket listening for persistent sessions.
+     * */
+    public SBusHandler createSession(final String strSessionPath)
+            throws IOException {
+        int nListen = SBusJNIObj_.createSession(strSessionPath);
+        if (0 > nListen)
+            throw new IOException("Unable to create session socket - "
+                    + strSessionPath);
+        return new SBusHandler(nListen);
+    }
+
+    /*------------------------------------------------------------------------
+     * Accept a session.
+     * */
+    public SBusHandler acceptSession(final SBusHandler hListen)
+            throws IOException {
+        int nSession = SBusJNIObj_.acceptSession(hListen.getFD());
+        if (0 > nSession)
+            throw new IOException("Unable to accept session");
+        return new SBusHandler(nSession);
+    }
+
+    /*------------------------------------------------------------------------
+     * Wait until any of the handlers gets readable.
+     * Returns the file descriptors of the readable handlers, which is empty
+     * when timed out.
+     * */
+    public int[] pollSBus(final int[] nBuses, final float fTimeout)
+            throws IOException {
+        int[] nReady = SBusJNIObj_.pollSBus(nBuses, fTimeout);
+        if (null == nReady)
+            throw new IOException("Unable to poll SBus");
+        return nReady;
+    }
+
+    /*------------------------------------------------------------------------
+     * Send a message over a session.
+     * */
+    public int sendSessionMessage(final SBusHandler hSession,
+            final String strMsg) throws IOException {
+        int nStatus = SBusJNIObj_.sendSessionMessage(hSession.getFD(), strMsg);
+        if (0 > nStatus)
+            throw new IOException("Unable to send message over session");
+        return nStatus;
+    }
+
+    /*------------------------------------------------------------------------
+     * Close the handler.
+     * */
+    public void closeSBus(final SBusHandler hSBus) {
+        SBusJNIObj_.closeSBus(hSBus.getFD());
+    }
 }
@@ -40,5 +40,15 @@ public class SBusJNI {
             final SBusRawMessage Msg);
 
     public native SBusRawMessage receiveRawMessage(int nBus);
+
+    public native int createSession(final String strSessionPath);
+
+    public native int acceptSession(int nListen);
+
+    public native int[] pollSBus(int[] nBuses, float fTimeout);
+
+    public native int sendSessionMessage(int nSession, final String strMsg);
+
+    public native void closeSBus(int nBus);
 }
 /* ============================== END OF FILE =============================== */
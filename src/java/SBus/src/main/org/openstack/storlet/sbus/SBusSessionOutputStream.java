@@ -0,0 +1,55 @@
+/*----------------------------------------------------------------------------
+ * Copyright (c) 2026 OpenStack Foundation
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * Limitations under the License.
+ * ---------------------------------------------------------------------------
+ */
+
+package org.openstack.storlet.sbus;
+
+import java.io.ByteArrayOutputStream;
+import java.io.IOException;
+import java.nio.charset.StandardCharsets;
+
+/*----------------------------------------------------------------------------
+ * SBusSessionOutputStream
+ *
+ * Service out stream for a request received over a persistent session.
+ * The response written to this stream is sent back over the session,
+ * as a single message, when the stream is closed.
+ * */
+public class SBusSessionOutputStream extends ByteArrayOutputStream {
+    private SBus sbus_;
+    private SBusHandler hSession_;
+    private long requestId_;
+    private boolean closed_ = false;
+
+    public SBusSessionOutputStream(final SBus sbus,
+            final SBusHandler hSession, final long requestId) {
+        this.sbus_ = sbus;
+        this.hSession_ = hSession;
+        this.requestId_ = requestId;
+    }
+
+    public long getRequestId() {
+        return requestId_;
+    }
+
+    @Override
+    public void close() throws IOException {
+        if (closed_)
+            return;
+        closed_ = true;
+        sbus_.sendSessionMessage(hSession_,
+                new String(toByteArray(), StandardCharsets.UTF_8));
+    }
+}
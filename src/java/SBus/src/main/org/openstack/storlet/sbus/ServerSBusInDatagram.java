@@ -29,6 +29,7 @@
 package org.openstack.storlet.sbus;
 
 import java.io.FileDescriptor;
+import java.io.OutputStream;
 import java.util.ArrayList;
 import java.util.Iterator;
 import java.util.HashMap;
@@ -49,6 +50,8 @@ public class ServerSBusInDatagram {
     private HashMap<String, String> params;
     private HashMap<String, HashMap<String, String>>[] metadata;
     private String taskID;
+    private Long requestID;
+    private OutputStream sessionOut;
 
     private void populateMetadata(HashMap<String, String> dest, JSONObject source) throws ParseException {
         for (Object key : source.keySet()) {
@@ -70,7 +73,8 @@ public class ServerSBusInDatagram {
      *         "key1": "value1",
      *         ...
      *     },
-     *     "task_id": "task id encoded as string" // This element is optional
+     *     "task_id": "task id encoded as string", // This element is optional
+     *     "request_id": 1 // Integer given to requests sent over a session
      * }
      * File descriptors metadata, encoded as a JSON array with one
      * element per file descriptor. The i'th element in the array
@@ -112,8 +116,15 @@ public class ServerSBusInDatagram {
         if (jsonCmdParams.containsKey("task_id")) {
             this.taskID = (String)jsonCmdParams.get("task_id");
         }
+        if (jsonCmdParams.containsKey("request_id")) {
+            this.requestID = ((Number)jsonCmdParams.get("request_id")).longValue();
+        }
 
         String strMD = msg.getMetadata();
+        if (strMD == null || strMD.isEmpty()) {
+            // Metadata is omitted when no file descriptor is passed
+            strMD = "[]";
+        }
         this.metadata = (HashMap<String, HashMap<String, String>>[])new HashMap[getNFiles()];
         JSONArray jsonarray = (JSONArray)(new JSONParser().parse(strMD));
         Iterator<JSONObject> it = jsonarray.iterator();
@@ -160,4 +171,20 @@ public class ServerSBusInDatagram {
     public HashMap<String, HashMap<String, String>>[] getFilesMetadata() {
         return metadata;
     }
+
+    public Long getRequestId() {
+        return requestID;
+    }
+
+    /**
+     * The stream to respond to the request received over a session, or
+     * null when the request is received over the datagram socket.
+     */
+    public OutputStream getSessionOut() {
+        return sessionOut;
+    }
+
+    public void setSessionOut(final OutputStream sessionOut) {
+        this.sessionOut = sessionOut;
+    }
 }
@@ -18,11 +18,15 @@ package org.openstack.storlet.daemon;
 
 import java.io.IOException;
 import java.io.OutputStream;
+import java.nio.ByteBuffer;
+import java.nio.charset.StandardCharsets;
 import org.json.simple.JSONArray;
 import org.json.simple.JSONObject;
 
 import org.slf4j.Logger;
 
+import org.openstack.storlet.sbus.SBusSessionOutputStream;
+
 /*----------------------------------------------------------------------------
  * SAbstractTask
  *
@@ -32,6 +36,14 @@ public abstract class SAbstractTask {
 
     protected Logger logger;
 
+    /*
+     * Responses are wrapped in a length-prefixed frame, the magic followed
+     * by the payload length in network byte order. This should be kept
+     * consistent with storlets/sbus/response.py
+     */
+    private static final byte[] RESPONSE_FRAME_MAGIC =
+        "SBR1".getBytes(StandardCharsets.US_ASCII);
+
     public SAbstractTask(Logger logger) {
         this.logger = logger;
     }
@@ -44,8 +56,28 @@ public abstract class SAbstractTask {
             obj.put("task_id", taskid);
         }
         boolean bStatus = true;
+        if (ostream instanceof SBusSessionOutputStream) {
+            // Session responses are sent as one message, tagged with
+            // the request id instead of framed
+            obj.put("request_id",
+                ((SBusSessionOutputStream)ostream).getRequestId());
+            try {
+                ostream.write(obj.toJSONString().getBytes(StandardCharsets.UTF_8));
+                ostream.close();
+            } catch (IOException e) {
+                e.printStackTrace();
+                bStatus = false;
+            }
+            return bStatus;
+        }
         try {
-            ostream.write(obj.toJSONString().getBytes());
+            byte[] payload = obj.toJSONString().getBytes(StandardCharsets.UTF_8);
+            ByteBuffer frame = ByteBuffer.allocate(
+                RESPONSE_FRAME_MAGIC.length + 4 + payload.length);
+            frame.put(RESPONSE_FRAME_MAGIC);
+            frame.putInt(payload.length);
+            frame.put(payload);
+            ostream.write(frame.array());
             ostream.flush();
             ostream.close();
         } catch (IOException e) {
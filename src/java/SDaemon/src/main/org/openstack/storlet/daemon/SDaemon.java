@@ -19,6 +19,7 @@ package org.openstack.storlet.daemon;
 
 import java.io.OutputStream;
 import java.io.IOException;
+import java.util.List;
 
 import org.slf4j.LoggerFactory;
 import ch.qos.logback.classic.Logger;
@@ -44,6 +45,7 @@ public class SDaemon {
     private static String strStorletName_;
     private static SExecutionManager sExecManager_;
     private static float fDefaultListenTimeout_ = 300.0F;
+    private static boolean bEnableSession_ = false;
 
     private static boolean initLog(final String strClassName,
             final String strLogLevel) {
@@ -84,6 +86,7 @@ public class SDaemon {
      * args[2] - log level
      * args[3] - thread pool size
      * args[4] - container id
+     * args[5] - optional, --enable-session to accept persistent sessions
      *
      * Invocation from CLI example:
      * java -Djava.library.path=. ...
@@ -115,6 +118,7 @@ public class SDaemon {
         String strLogLevel = args[2];
         int nPoolSize = Integer.parseInt(args[3]);
         String strContId = args[4];
+        bEnableSession_ = args.length > 5 && args[5].equals("--enable-session");
 
         if (initLog(strStorletName_, strLogLevel) == false)
             return;
@@ -130,6 +134,8 @@ public class SDaemon {
         try {
             logger_.trace("Initialising SBus");
             sbus_.create(strSBusPath);
+            if (bEnableSession_)
+                sbus_.createSession(strSBusPath);
         } catch (IOException e) {
             logger_.error(strStorletName_ + ": Failed to create SBus");
             return;
@@ -145,6 +151,10 @@ public class SDaemon {
      * The main loop - listen, receive, execute till the HALT command.
      * */
     private static void mainLoop() throws Exception {
+        if (bEnableSession_) {
+            sessionLoop();
+            return;
+        }
         boolean doContinue = true;
         while (doContinue) {
             // Wait for incoming commands
@@ -176,6 +186,46 @@ public class SDaemon {
         }
     }
 
+    /*------------------------------------------------------------------------
+     * sessionLoop
+     *
+     * The main loop when sessions are enabled - listen on the SBus and
+     * the sessions, receive, execute till the HALT command.
+     * */
+    private static void sessionLoop() throws Exception {
+        boolean doContinue = true;
+        while (doContinue) {
+            List<SBusHandler> ready;
+            try {
+                logger_.trace(strStorletName_ + ": polling SBus and sessions");
+                ready = sbus_.poll(fDefaultListenTimeout_);
+            } catch (IOException e) {
+                logger_.error(strStorletName_ + ": Failed to listen on SBus");
+                break;
+            }
+
+            for (SBusHandler hSBus : ready) {
+                ServerSBusInDatagram dtg = null;
+                try {
+                    dtg = sbus_.receive(hSBus);
+                } catch (Exception e) {
+                    logger_.error(strStorletName_
+                            + ": Failed to receive data on SBus", e);
+                    if (!sbus_.isSession(hSBus)) {
+                        doContinue = false;
+                        break;
+                    }
+                }
+                if (null == dtg)
+                    // The session is closed or sent a broken request
+                    continue;
+                doContinue = processDatagram(dtg);
+                if (!doContinue)
+                    break;
+            }
+        }
+    }
+
     /*------------------------------------------------------------------------
      * processDatagram
      *
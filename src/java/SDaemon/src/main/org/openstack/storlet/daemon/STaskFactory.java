@@ -82,7 +82,8 @@ public class STaskFactory {
         int nFiles = dtg.getNFiles();
         HashMap<String, HashMap<String, String>>[] FilesMD = dtg.getFilesMetadata();
         this.logger_.trace("StorletTask: Got " + nFiles + " fds");
-        OutputStream sOut = null;
+        // Requests over a session do not carry SBUS_FD_SERVICE_OUT
+        OutputStream sOut = dtg.getSessionOut();
         for (int i = 0; i < nFiles; ++i) {
             HashMap<String, String> storletsMetadata = FilesMD[i].get("storlets");
             HashMap<String, String> storageMetadata = FilesMD[i].get("storage");
@@ -149,6 +150,19 @@ public class STaskFactory {
         String taskId = dtg.getTaskId();
         boolean bStatus = true;
 
+        OutputStream sessionOut = dtg.getSessionOut();
+        if (null != sessionOut) {
+            // The response is sent over the session the request came from
+            if (0 != dtg.getNFiles()) {
+                this.logger_.error("createCancelTask: "
+                        + "Wrong fd count for session command. "
+                        + "Expected 0, got " + dtg.getNFiles());
+                return null;
+            }
+            OutputStream sOut = sessionOut;
+            return new SCancelTask(sOut, logger_, sExecManager, taskId);
+        }
+
         if (1 != dtg.getNFiles()) {
             this.logger_.error("createCancelTask: "
                     + "Wrong fd count for descriptor command. "
@@ -184,6 +198,19 @@ public class STaskFactory {
         SHaltTask ResObj = null;
         boolean bStatus = true;
 
+        OutputStream sessionOut = dtg.getSessionOut();
+        if (null != sessionOut) {
+            // The response is sent over the session the request came from
+            if (0 != dtg.getNFiles()) {
+                this.logger_.error("createHaltTask: "
+                        + "Wrong fd count for session command. "
+                        + "Expected 0, got " + dtg.getNFiles());
+                return null;
+            }
+            OutputStream sOut = sessionOut;
+            return new SHaltTask(sOut, logger_);
+        }
+
         if (1 != dtg.getNFiles()) {
             this.logger_.error("createHaltTask: "
                     + "Wrong fd count for descriptor command. "
@@ -218,6 +245,19 @@ public class STaskFactory {
         SPingTask ResObj = null;
         boolean bStatus = true;
 
+        OutputStream sessionOut = dtg.getSessionOut();
+        if (null != sessionOut) {
+            // The response is sent over the session the request came from
+            if (0 != dtg.getNFiles()) {
+                this.logger_.error("createPingTask: "
+                        + "Wrong fd count for session command. "
+                        + "Expected 0, got " + dtg.getNFiles());
+                return null;
+            }
+            OutputStream sOut = sessionOut;
+            return new SPingTask(sOut, logger_);
+        }
+
         if (1 != dtg.getNFiles()) {
             this.logger_.error("createPingTask: "
                     + "Wrong fd count for descriptor command. "
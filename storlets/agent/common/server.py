@@ -15,10 +15,15 @@
 from functools import partial
 import json
 import os
+import select
 import signal
 
 from storlets.sbus import SBus
 import storlets.sbus.command as sbus_cmd
+from storlets.sbus.response import pack_response_frame
+from storlets.sbus.session import create_session_listener, get_session_path, \
+    send_response
+from storlets.sbus.socket_sbus import receive_message
 
 EXIT_SUCCESS = 0
 EXIT_FAILURE = 1
@@ -57,6 +62,19 @@ class CommandResponse(Exception):
             rsp['task_id'] = self.task_id
         return json.dumps(rsp)
 
+    def session_message(self, request_id):
+        """
+        Get the message to be sent back over a sbus session
+
+        :param request_id: id of the request to respond to
+        :returns: json serialized response tagged with the request id
+        """
+        rsp = {'status': self.status, 'message': self.message,
+               'request_id': request_id}
+        if self.task_id:
+            rsp['task_id'] = self.task_id
+        return json.dumps(rsp)
+
 
 CommandSuccess = partial(CommandResponse, True)
 CommandFailure = partial(CommandResponse, False)
@@ -77,13 +95,22 @@ class SBusServer(object):
     NOTE(takash): we should implement some termination functions like
                   _terminate and halt, otherwise they raise
                   NotImplementedError.
+
+    :param sbus_path: path string to sbus
+    :param logger: a logger instance
+    :param enable_session: whether to accept persistent sessions in addition
+                           to the datagram socket
     """
-    def __init__(self, sbus_path, logger):
+    def __init__(self, sbus_path, logger, enable_session=False):
         self.sbus_path = sbus_path
         self.logger = logger
         self.running = True
         self.listen_timeout = LISTEN_TIMEOUT
         self.loop_timeout = LOOP_TIMEOUT
+        self.enable_session = enable_session
+        self.session_listener = None
+        # fileno -> connected session socket
+        self.sessions = {}
 
     def get_handler(self, command):
         """
@@ -105,11 +132,12 @@ class SBusServer(object):
                              command)
         return handler
 
-    def dispatch_command(self, dtg):
+    def dispatch_command(self, dtg, session=None):
         """
         Parse datagram. React on the request.
 
         :param dtg: Datagram received from client
+        :param session: session socket the datagram is received from, if any
 
         :returns: True if the server can continue its main loop
                   False if the server should terminate its main loop
@@ -132,9 +160,12 @@ class SBusServer(object):
         self.logger.info('Command:%s Response:%s' %
                          (command, resp.report_message))
 
-        outfd = dtg.service_out_fd
-        with os.fdopen(outfd, 'wb') as outfile:
-            self._respond(outfile, resp)
+        if session is not None:
+            self._respond_session(session, dtg.request_id, resp)
+        else:
+            outfd = dtg.service_out_fd
+            with os.fdopen(outfd, 'wb') as outfile:
+                self._respond(outfile, resp)
 
         return resp.iterable
 
@@ -142,14 +173,131 @@ class SBusServer(object):
         """
         Send result description message back to gateway
 
+        The message is wrapped in a length-prefixed frame so that the client
+        can read it without waiting for EOF.
+
         :param outfile : Output channel to send the message to
         :param resp: CommandResponse instance
         """
         try:
-            outfile.write(resp.report_message.encode('utf-8'))
+            outfile.write(
+                pack_response_frame(resp.report_message.encode('utf-8')))
         except IOError:
             self.logger.exception('Unable to return response to client')
 
+    def _respond_session(self, session, request_id, resp):
+        """
+        Send result description message back to gateway over a session
+
+        :param session: session socket the request is received from
+        :param request_id: id of the request
+        :param resp: CommandResponse instance
+        """
+        try:
+            send_response(session, resp.session_message(request_id))
+        except OSError:
+            self.logger.exception('Unable to return response to client')
+            self._close_session(session)
+
+    def _open_session_listener(self):
+        try:
+            self.session_listener = create_session_listener(self.sbus_path)
+        except OSError:
+            # We can still serve requests over the datagram socket
+            self.logger.exception('Failed to create session socket')
+
+    def _accept_session(self):
+        try:
+            session, _ = self.session_listener.accept()
+        except OSError:
+            self.logger.exception('Failed to accept session')
+            return
+        self.sessions[session.fileno()] = session
+        self.logger.debug('Accepted session %d' % session.fileno())
+
+    def _close_session(self, session):
+        self.sessions.pop(session.fileno(), None)
+        session.close()
+
+    def _close_sessions(self):
+        """
+        Close the session listener and all sessions
+        """
+        for session in list(self.sessions.values()):
+            self._close_session(session)
+        if self.session_listener is not None:
+            self.session_listener.close()
+            self.session_listener = None
+
+    def _cleanup_sessions(self):
+        had_listener = self.session_listener is not None
+        self._close_sessions()
+        if had_listener:
+            try:
+                os.unlink(get_session_path(self.sbus_path))
+            except OSError:
+                pass
+
+    def _wait_requests(self, sbus, fd):
+        """
+        Wait until requests arrive at the sbus or any of the sessions
+
+        :param sbus: SBus instance
+        :param fd: sbus handler
+        :returns: a list of readable file descriptors, which is empty when
+                  timed out, or None when an error occurs
+        """
+        if self.session_listener is None:
+            rc = sbus.listen(fd, self.loop_timeout)
+            if rc < 0:
+                return None
+            return [fd] if rc else []
+
+        fds = [fd, self.session_listener.fileno()] + list(self.sessions)
+        try:
+            readable, _, _ = select.select(fds, [], [], self.loop_timeout)
+        except (OSError, ValueError):
+            return None
+        return readable
+
+    def _process_request(self, sbus, fd, ready_fd):
+        """
+        Receive and process a request from the readable file descriptor
+
+        :returns: EXIT_SUCCESS or EXIT_FAILURE when the main loop should
+                  stop, otherwise None
+        """
+        if ready_fd == fd:
+            dtg = sbus.receive(fd)
+            if dtg is None:
+                self.logger.error("Failed to receive message. exiting")
+                return EXIT_FAILURE
+            if not self.dispatch_command(dtg):
+                return EXIT_SUCCESS
+            return None
+
+        if ready_fd == self.session_listener.fileno():
+            self._accept_session()
+            return None
+
+        session = self.sessions.get(ready_fd)
+        if session is None:
+            # The session was closed while processing the other requests
+            return None
+        dtg = receive_message(session)
+        if dtg is None:
+            self.logger.debug('Session %d is closed' % ready_fd)
+            self._close_session(session)
+            return None
+        if dtg.request_id is None:
+            self.logger.error('Received request without request id over '
+                              'session %d' % ready_fd)
+            self._close_session(session)
+            return None
+        if not self.dispatch_command(dtg, session):
+            return EXIT_SUCCESS
+        return None
+
     @command_handler
     def ping(self, dtg):
         self.logger.debug('Received ping. Responding')
@@ -192,20 +340,23 @@ class SBusServer(object):
             self.logger.error("Failed to create SBus. exiting.")
             return EXIT_FAILURE
 
+        if self.enable_session:
+            self._open_session_listener()
+
         signal.signal(signal.SIGHUP, self._graceful_shutdown)
         signal.signal(signal.SIGTERM, self._force_shutdown)
 
         loop_cnt = 0
-        status = EXIT_SUCCESS
+        status = None
 
-        while self.running:
-            rc = sbus.listen(fd, self.loop_timeout)
+        while self.running and status is None:
+            ready_fds = self._wait_requests(sbus, fd)
 
-            if rc < 0:
+            if ready_fds is None:
                 self.logger.error("Failed to wait on SBus. exiting.")
                 status = EXIT_FAILURE
                 break
-            elif rc == 0:
+            elif not ready_fds:
                 loop_cnt += 1
                 if loop_cnt * self.loop_timeout >= self.listen_timeout:
                     self.logger.debug("Timed out while listening. exiting.")
@@ -215,16 +366,13 @@ class SBusServer(object):
             # Reset loop_cnt here as a request comes via sbus
             loop_cnt = 0
 
-            dtg = sbus.receive(fd)
-            if dtg is None:
-                self.logger.error("Failed to receive message. exiting")
-                status = EXIT_FAILURE
-                break
-
-            if not self.dispatch_command(dtg):
-                break
+            for ready_fd in ready_fds:
+                status = self._process_request(sbus, fd, ready_fd)
+                if status is not None:
+                    break
 
+        self._cleanup_sessions()
         self.logger.debug('Leaving main loop')
         self._terminate()
 
-        return status
+        return EXIT_SUCCESS if status is None else status
@@ -41,10 +41,13 @@ class StorletDaemon(SBusServer):
     :param sbus_path: path string to sbus
     :param logger: a logger instance
     :param pool_size: an integer for concurrency running the storlet apps
+    :param enable_session: whether to accept persistent sbus sessions
     """
 
-    def __init__(self, storlet_name, sbus_path, logger, pool_size):
-        super(StorletDaemon, self).__init__(sbus_path, logger)
+    def __init__(self, storlet_name, sbus_path, logger, pool_size,
+                 enable_session=False):
+        super(StorletDaemon, self).__init__(sbus_path, logger,
+                                            enable_session)
 
         self.storlet_name = str(storlet_name)
         try:
@@ -173,7 +176,10 @@ class StorletDaemon(SBusServer):
                 # We do not use invocation fds in main process, so close them
                 self._safe_close(fd)
         else:
-            self._safe_close(dtg.service_out_fd)
+            if dtg.service_out_fd is not None:
+                self._safe_close(dtg.service_out_fd)
+            # The sessions are served only by the main process
+            self._close_sessions()
             self._execute(dtg)
             sys.exit()
 
@@ -253,6 +259,8 @@ def main():
                         help='the maximum thread numbers used swapns for '
                              'one storlet application')
     parser.add_argument('container_id', help='container id')
+    parser.add_argument('--enable-session', action='store_true',
+                        help='accept persistent sbus sessions')
     opts = parser.parse_args()
 
     # Initialize logger
@@ -265,7 +273,8 @@ def main():
 
         # create an instance of storlet daemon
         daemon = StorletDaemon(opts.storlet_name, opts.sbus_path,
-                               logger, opts.pool_size)
+                               logger, opts.pool_size,
+                               enable_session=opts.enable_session)
 
         # Start the main loop
         sys.exit(daemon.main_loop())
@@ -38,13 +38,17 @@ class StorletDaemonFactory(SBusServer):
     An SBusServer implementation for storlets application factory
     """
 
-    def __init__(self, sbus_path, logger, container_id):
+    def __init__(self, sbus_path, logger, container_id,
+                 enable_session=False):
         """
         :param sbus_path: Path to the pipe file internal SBus listens to
         :param logger: Logger to dump the information to
         :param container_id: Container id
+        :param enable_session: Whether to accept persistent sbus sessions,
+                               and let storlet daemons accept them
         """
-        super(StorletDaemonFactory, self).__init__(sbus_path, logger)
+        super(StorletDaemonFactory, self).__init__(sbus_path, logger,
+                                                   enable_session)
         self.container_id = container_id
         # Dictionary: map storlet name to pipe name
         self.storlet_name_to_pipe_name = dict()
@@ -91,6 +95,8 @@ class StorletDaemonFactory(SBusServer):
 
         pargs = ['/usr/bin/java', str_daemon_main_class, storlet_name,
                  uds_path, log_level, str(pool_size), self.container_id]
+        if self.enable_session:
+            pargs.append('--enable-session')
         return pargs, env
 
     def get_python_args(self, daemon_language, storlet_path, storlet_name,
@@ -101,6 +107,8 @@ class StorletDaemonFactory(SBusServer):
         str_daemon_main_file = '/usr/local/libexec/storlets/storlets-daemon'
         pargs = [python_interpreter, str_daemon_main_file, storlet_name,
                  uds_path, log_level, str(pool_size), self.container_id]
+        if self.enable_session:
+            pargs.append('--enable-session')
 
         python_path = os.path.join('/var/lib/storlets', storlet_name)
         if os.environ.get('PYTHONPATH'):
@@ -522,6 +530,9 @@ def main():
     parser.add_argument('sbus_path', help='the path to unix domain socket')
     parser.add_argument('log_level', help='log level')
     parser.add_argument('container_id', help='container id')
+    parser.add_argument('--enable-session', action='store_true',
+                        help='accept persistent sbus sessions, and let '
+                             'storlet daemons accept them')
     opts = parser.parse_args()
 
     # Initialize logger
@@ -533,7 +544,8 @@ def main():
                           container_id=opts.container_id)
         # create an instance of daemon_factory
         factory = StorletDaemonFactory(opts.sbus_path, logger,
-                                       opts.container_id)
+                                       opts.container_id,
+                                       enable_session=opts.enable_session)
 
         # Start the main loop
         sys.exit(factory.main_loop())
@@ -20,7 +20,7 @@ import shutil
 from storlets.gateway.common.stob import StorletRequest
 from storlets.gateway.gateways.base import StorletGatewayBase
 from storlets.gateway.gateways.container.runtime import RunTimePaths, \
-    StorletInvocationProtocol
+    StorletInvocationProtocol, config_true_value
 
 
 class ContainerStorletRequest(StorletRequest):
@@ -82,6 +82,9 @@ class StorletGatewayContainer(StorletGatewayBase):
         """
         super(StorletGatewayContainer, self).__init__(conf, logger, scope)
         self.storlet_timeout = float(self.conf.get('storlet_timeout', 40))
+        self.sbus_backend = self.conf.get('sbus_backend')
+        self.sbus_session = config_true_value(
+            self.conf.get('sbus_session', False))
         self.paths = RunTimePaths(scope, conf)
 
     @classmethod
@@ -190,7 +193,9 @@ class StorletGatewayContainer(StorletGatewayBase):
                                               storlet_pipe_path,
                                               slog_path,
                                               self.storlet_timeout,
-                                              self.logger)
+                                              self.logger,
+                                              self.sbus_backend,
+                                              self.sbus_session)
 
         sresp = sprotocol.communicate()
 
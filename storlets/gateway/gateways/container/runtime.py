@@ -39,6 +39,22 @@ MAX_METADATA_SIZE = 4096
 
 eventlet.monkey_patch()
 
+TRUE_VALUES = {'true', '1', 'yes', 'on', 't', 'y'}
+
+
+def config_true_value(value):
+    """
+    Check whether the given config value means True
+
+    This is the same as swift.common.utils.config_true_value, which can not
+    be used here because gateways should not depend on swift.
+
+    :param value: config value
+    :returns: True if the value is True or a string which means true
+    """
+    return value is True or \
+        (isinstance(value, str) and value.lower() in TRUE_VALUES)
+
 
 class RunTimePaths(object):
     """
@@ -250,6 +266,9 @@ class RunTimeSandbox(object, metaclass=abc.ABCMeta):
         self.container_pids_limit = \
             self._load_int_opt(conf, 'container_pids_limit')
 
+        self.sbus_backend = conf.get('sbus_backend')
+        self.sbus_session = config_true_value(conf.get('sbus_session', False))
+
     def _load_int_opt(self, conf, key):
         if key not in conf:
             return None
@@ -264,7 +283,8 @@ class RunTimeSandbox(object, metaclass=abc.ABCMeta):
                   to send command to the process
         """
         pipe_path = self.paths.host_factory_pipe
-        client = SBusClient(pipe_path)
+        client = SBusClient(pipe_path, sbus_backend=self.sbus_backend,
+                            use_session=self.sbus_session)
         try:
             resp = client.ping()
             if not resp.status:
@@ -305,11 +325,14 @@ class RunTimeSandbox(object, metaclass=abc.ABCMeta):
         :param container_name: name of the container
         :returns: command arguments
         """
-        return [
+        command = [
             self.paths.sandbox_factory_pipe,
             self.storlet_daemon_factory_debug_level,
             container_name
         ]
+        if self.sbus_session:
+            command.append('--enable-session')
+        return command
 
     def _get_container_entrypoint(self):
         """
@@ -409,7 +432,8 @@ class RunTimeSandbox(object, metaclass=abc.ABCMeta):
         Start SDaemon process in the scope's sandbox
         """
         pipe_path = self.paths.host_factory_pipe
-        client = SBusClient(pipe_path)
+        client = SBusClient(pipe_path, sbus_backend=self.sbus_backend,
+                            use_session=self.sbus_session)
         try:
             resp = client.start_daemon(
                 language.lower(), spath, storlet_id,
@@ -430,7 +454,8 @@ class RunTimeSandbox(object, metaclass=abc.ABCMeta):
         Stop SDaemon process in the scope's sandbox
         """
         pipe_path = self.paths.host_factory_pipe
-        client = SBusClient(pipe_path)
+        client = SBusClient(pipe_path, sbus_backend=self.sbus_backend,
+                            use_session=self.sbus_session)
         try:
             resp = client.stop_daemon(storlet_id)
             if not resp.status:
@@ -450,7 +475,8 @@ class RunTimeSandbox(object, metaclass=abc.ABCMeta):
                                          daemon-factory
         """
         pipe_path = self.paths.host_factory_pipe
-        client = SBusClient(pipe_path)
+        client = SBusClient(pipe_path, sbus_backend=self.sbus_backend,
+                            use_session=self.sbus_session)
         try:
             resp = client.daemon_status(storlet_id)
             if resp.status:
@@ -530,14 +556,20 @@ class StorletInvocationProtocol(object):
     :param storlet_logger_path: path string to log file
     :param timeout: integer of timeout for waiting the resp from container
     :param logger: logger instance
+    :param sbus_backend: name of the sbus backend used to communicate with
+                         the storlet daemon
+    :param sbus_session: whether to communicate with the storlet daemon
+                         over a persistent sbus session
     """
     def __init__(self, srequest, storlet_pipe_path, storlet_logger_path,
-                 timeout, logger):
+                 timeout, logger, sbus_backend=None, sbus_session=False):
         self.srequest = srequest
         self.storlet_pipe_path = storlet_pipe_path
         self.storlet_logger = StorletLogger(storlet_logger_path)
         self.logger = logger
         self.timeout = timeout
+        self.sbus_backend = sbus_backend
+        self.sbus_session = sbus_session
 
         # local side file descriptors
         self.data_read_fd = None
@@ -672,7 +704,9 @@ class StorletInvocationProtocol(object):
         """
         Cancel on-going storlet execution
         """
-        client = SBusClient(self.storlet_pipe_path)
+        client = SBusClient(self.storlet_pipe_path,
+                            sbus_backend=self.sbus_backend,
+                            use_session=self.sbus_session)
         try:
             resp = client.cancel(self.task_id)
             if not resp.status:
@@ -693,7 +727,9 @@ class StorletInvocationProtocol(object):
         Send execute command to the remote daemon factory to invoke storlet
         execution
         """
-        client = SBusClient(self.storlet_pipe_path)
+        client = SBusClient(self.storlet_pipe_path,
+                            sbus_backend=self.sbus_backend,
+                            use_session=self.sbus_session)
         try:
             resp = client.execute(self.srequest.params, self.remote_fds)
             if not resp.status:
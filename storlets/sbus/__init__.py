@@ -12,8 +12,11 @@
 # implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from storlets.sbus.sbus import SBus
+from storlets.sbus.sbus import SBus, get_sbus_class
+from storlets.sbus.socket_sbus import SocketSBus
 
 __all__ = [
     'SBus',
+    'SocketSBus',
+    'get_sbus_class',
 ]
@@ -14,12 +14,15 @@
 # limitations under the License.
 import json
 import os
-from storlets.sbus import SBus
+from storlets.sbus import get_sbus_class
 from storlets.sbus import command as sbus_cmd
 from storlets.sbus.datagram import SBusFileDescriptor, build_datagram
 from storlets.sbus.file_description import SBUS_FD_SERVICE_OUT
+from storlets.sbus.response import RESPONSE_FRAME_HEADER_SIZE, \
+    unpack_response_frame_header
 from storlets.sbus.client.exceptions import SBusClientIOError, \
     SBusClientMalformedResponse, SBusClientSendError
+from storlets.sbus.client.session import get_session
 
 
 class SBusResponse(object):
@@ -37,9 +40,21 @@ class SBusResponse(object):
 
 
 class SBusClient(object):
-    def __init__(self, socket_path, chunk_size=16):
+    def __init__(self, socket_path, chunk_size=4096, sbus_backend=None,
+                 use_session=False):
+        """
+        Construct SBusClient class
+
+        :param socket_path: path to the sbus socket of the server
+        :param chunk_size: initial size of the buffer to read response
+        :param sbus_backend: name of the sbus backend
+        :param use_session: whether to send requests over a persistent
+                            session, when the server accepts it
+        """
         self.socket_path = socket_path
         self.chunk_size = chunk_size
+        self.sbus = get_sbus_class(sbus_backend)
+        self.use_session = use_session
 
     def _parse_response(self, str_response):
         """
@@ -62,7 +77,69 @@ class SBusClient(object):
 
         return SBusResponse(status, message, task_id)
 
+    def _readinto(self, read_fd, buf, offset):
+        with memoryview(buf) as view:
+            try:
+                return os.readv(read_fd, [view[offset:]])
+            except OSError:
+                raise SBusClientIOError(
+                    'Failed to read data from read pipe')
+
+    def _read_response(self, read_fd):
+        """
+        Read response from the read pipe
+
+        The response is read into a preallocated buffer. When the server
+        sends a length-prefixed frame, reading stops as soon as the whole
+        payload arrives, which usually needs only one read call. Responses
+        from old servers, which are not framed, are read until EOF.
+
+        :param read_fd: read end of the pipe passed to the server
+        :returns: response payload bytes
+        :raises SBusClientIOError: when failed to read the pipe
+        :raises SBusClientMalformedResponse: when the frame is truncated
+        """
+        buf = bytearray(max(self.chunk_size, RESPONSE_FRAME_HEADER_SIZE))
+        received = 0
+        expected = None
+        framed = None
+        while expected is None or received < expected:
+            if received == len(buf):
+                buf.extend(bytes(len(buf)))
+            size = self._readinto(read_fd, buf, received)
+            if not size:
+                break
+            received += size
+
+            if framed is None and received >= RESPONSE_FRAME_HEADER_SIZE:
+                length = unpack_response_frame_header(buf)
+                framed = length is not None
+                if framed:
+                    expected = RESPONSE_FRAME_HEADER_SIZE + length
+                    if len(buf) < expected:
+                        buf.extend(bytes(expected - len(buf)))
+
+        if framed:
+            if received < expected:
+                raise SBusClientMalformedResponse('Got truncated response')
+            return bytes(buf[RESPONSE_FRAME_HEADER_SIZE:expected])
+        return bytes(buf[:received])
+
+    def _session_request(self, session, command, params, task_id,
+                         extra_fds):
+        datagram = build_datagram(command, extra_fds or [], params, task_id,
+                                  session.next_request_id())
+        return session.request(datagram)
+
     def _request(self, command, params=None, task_id=None, extra_fds=None):
+        if self.use_session:
+            session = get_session(self.socket_path)
+            if session is not None:
+                return self._parse_response(self._session_request(
+                    session, command, params, task_id, extra_fds))
+            # The server does not accept sessions, so fall back to the
+            # datagram
+
         read_fd, write_fd = os.pipe()
         try:
             try:
@@ -70,7 +147,7 @@ class SBusClient(object):
                     [SBusFileDescriptor(SBUS_FD_SERVICE_OUT, write_fd)] + \
                     (extra_fds or [])
                 datagram = build_datagram(command, sfds, params, task_id)
-                rc = SBus.send(self.socket_path, datagram)
+                rc = self.sbus.send(self.socket_path, datagram)
                 if rc < 0:
                     raise SBusClientSendError(
                         'Faild to send command(%s) to socket %s' %
@@ -80,16 +157,7 @@ class SBusClient(object):
                 # in local side before reading response
                 os.close(write_fd)
 
-            reply = b''
-            while True:
-                try:
-                    buf = os.read(read_fd, self.chunk_size)
-                except IOError:
-                    raise SBusClientIOError(
-                        'Failed to read data from read pipe')
-                if not buf:
-                    break
-                reply = reply + buf
+            reply = self._read_response(read_fd)
         finally:
             os.close(read_fd)
 
@@ -0,0 +1,196 @@
+# Copyright (c) 2026 OpenStack Foundation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import itertools
+import json
+import socket
+import threading
+import time
+
+from storlets.sbus.session import MAX_RESPONSE_LENGTH, connect_session, \
+    receive_response
+from storlets.sbus.socket_sbus import send_message
+from storlets.sbus.client.exceptions import SBusClientIOError, \
+    SBusClientMalformedResponse, SBusClientSendError
+
+
+class SBusSession(object):
+    """
+    A long-lived connection to the session socket of a sbus server
+
+    Multiple requests can be in flight at the same time. Each request is
+    tagged with a request id, and the responses are matched with the
+    requests by the id. One of the waiting callers reads the socket at a
+    time and hands the responses over to the others.
+
+    :param sbus_path: path to the datagram socket of the server
+    :param sock: connected session socket
+    """
+
+    def __init__(self, sbus_path, sock):
+        self.sbus_path = sbus_path
+        self.sock = sock
+        self.closed = False
+        self._request_ids = itertools.count(1)
+        self._send_lock = threading.Lock()
+        self._cond = threading.Condition()
+        self._reading = False
+        self._pending = set()
+        self._responses = {}
+
+    def next_request_id(self):
+        return next(self._request_ids)
+
+    def is_alive(self):
+        """
+        Check whether the session can be reused
+
+        An idle session can still have late responses to requests which
+        were given up by their callers. These are discarded here, and the
+        session is closed only when the server has closed it.
+        """
+        with self._cond:
+            if self.closed:
+                return False
+            if self._pending:
+                return True
+            while True:
+                try:
+                    msg = self.sock.recv(MAX_RESPONSE_LENGTH,
+                                         socket.MSG_DONTWAIT)
+                except BlockingIOError:
+                    return True
+                except OSError:
+                    msg = b''
+                if not msg:
+                    break
+        self.close()
+        return False
+
+    def close(self):
+        with self._cond:
+            if not self.closed:
+                self.closed = True
+                self.sock.close()
+            self._cond.notify_all()
+
+    def _receive(self):
+        try:
+            str_response = receive_response(self.sock)
+        except OSError:
+            raise SBusClientIOError('Failed to receive data from session')
+        except ValueError:
+            raise SBusClientMalformedResponse('Got malformed response')
+        if str_response is None:
+            raise SBusClientIOError('Session is closed by server')
+        try:
+            request_id = json.loads(str_response)['request_id']
+        except (ValueError, KeyError, TypeError):
+            raise SBusClientMalformedResponse('Got malformed response')
+        return request_id, str_response
+
+    def request(self, datagram):
+        """
+        Send a request and wait for its response
+
+        :param datagram: SBusDatagram instance with request id
+        :returns: json serialized response string
+        :raises SBusClientSendError: when failed to send the request
+        :raises SBusClientIOError: when the session is broken while waiting
+                                   for the response
+        """
+        request_id = datagram.request_id
+        with self._cond:
+            if self.closed:
+                raise SBusClientSendError('Session is already closed')
+            self._pending.add(request_id)
+
+        try:
+            with self._send_lock:
+                try:
+                    send_message(self.sock, datagram)
+                except OSError:
+                    self.close()
+                    raise SBusClientSendError(
+                        'Failed to send command(%s) to session %s' %
+                        (datagram.command, self.sbus_path))
+
+            with self._cond:
+                while request_id not in self._responses:
+                    if self.closed:
+                        raise SBusClientIOError(
+                            'Session is closed while waiting for response')
+                    if self._reading:
+                        self._cond.wait()
+                        continue
+
+                    # Become the reader until our response arrives
+                    self._reading = True
+                    self._cond.release()
+                    try:
+                        rid, str_response = self._receive()
+                    except (SBusClientIOError, SBusClientMalformedResponse):
+                        self.close()
+                        raise
+                    finally:
+                        self._cond.acquire()
+                        self._reading = False
+                        self._cond.notify_all()
+                    if rid in self._pending:
+                        self._responses[rid] = str_response
+                return self._responses.pop(request_id)
+        finally:
+            with self._cond:
+                self._pending.discard(request_id)
+                self._responses.pop(request_id, None)
+
+
+# How long to remember that a server does not accept sessions
+UNSUPPORTED_TTL = 60
+
+_sessions = {}
+# sbus path -> time until which no session is attempted
+_unsupported = {}
+_sessions_lock = threading.Lock()
+
+
+def get_session(sbus_path):
+    """
+    Get the session for the given server, connecting when needed
+
+    A failure to connect is remembered for UNSUPPORTED_TTL seconds, so that
+    requests to a server without sessions do not try to connect every time.
+
+    :param sbus_path: path to the datagram socket of the server
+    :returns: SBusSession instance, or None when the server does not accept
+              sessions
+    """
+    with _sessions_lock:
+        session = _sessions.get(sbus_path)
+        if session is not None and session.is_alive():
+            return session
+
+        now = time.time()
+        if _unsupported.get(sbus_path, 0) > now:
+            return None
+
+        try:
+            sock = connect_session(sbus_path)
+        except OSError:
+            _sessions.pop(sbus_path, None)
+            _unsupported[sbus_path] = now + UNSUPPORTED_TTL
+            return None
+        _unsupported.pop(sbus_path, None)
+        session = _sessions[sbus_path] = SBusSession(sbus_path, sock)
+        return session
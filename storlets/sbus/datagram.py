@@ -58,7 +58,8 @@ class SBusDatagram(object, metaclass=abc.ABCMeta):
     def _required_fdtypes(self):
         pass
 
-    def __init__(self, command, sfds, params=None, task_id=None):
+    def __init__(self, command, sfds, params=None, task_id=None,
+                 request_id=None):
         """
         Create SBusDatagram instance
 
@@ -68,8 +69,13 @@ class SBusDatagram(object, metaclass=abc.ABCMeta):
                        execution
         :param task_id: An optional string task id. This is currently used for
                         cancel command
+        :param request_id: An optional integer to identify the request sent
+                           over a sbus session. The response is sent back over
+                           the session, so the service out fd is not required
+                           when this is given.
         """
         self.command = command
+        self.request_id = request_id
         fdtypes = [sfd.fdtype for sfd in sfds]
         self._check_required_fdtypes(fdtypes)
         self.sfds = sfds
@@ -87,6 +93,8 @@ class SBusDatagram(object, metaclass=abc.ABCMeta):
             cmd_params['params'] = self.params
         if self.task_id:
             cmd_params['task_id'] = self.task_id
+        if self.request_id is not None:
+            cmd_params['request_id'] = self.request_id
         return cmd_params
 
     @property
@@ -143,12 +151,20 @@ class SBusDatagram(object, metaclass=abc.ABCMeta):
             #                fd validation.
             return ret[0]
 
+    @property
+    def _expected_fdtypes(self):
+        if self.request_id is None:
+            return self._required_fdtypes
+        # The response is sent back over the session
+        return [t for t in self._required_fdtypes
+                if t != sbus_fd.SBUS_FD_SERVICE_OUT]
+
     def _check_required_fdtypes(self, given_fdtypes):
-        if given_fdtypes[:len(self._required_fdtypes)] != \
-                self._required_fdtypes:
+        expected_fdtypes = self._expected_fdtypes
+        if given_fdtypes[:len(expected_fdtypes)] != expected_fdtypes:
             raise ValueError('Fd type mismatch given_fdtypes:%s \
                              required_fdtypes:%s' %
-                             (given_fdtypes, self._required_fdtypes))
+                             (given_fdtypes, expected_fdtypes))
 
     def __str__(self):
         return 'num_fds=%s, md=%s, cmd_params=%s' % (
@@ -176,9 +192,10 @@ class SBusServiceDatagram(SBusDatagram):
     def _required_fdtypes(self):
         return [sbus_fd.SBUS_FD_SERVICE_OUT]
 
-    def __init__(self, command, sfds, params=None, task_id=None):
+    def __init__(self, command, sfds, params=None, task_id=None,
+                 request_id=None):
         super(SBusServiceDatagram, self).__init__(
-            command, sfds, params, task_id)
+            command, sfds, params, task_id, request_id)
 
     @property
     def service_out_fd(self):
@@ -197,7 +214,8 @@ class SBusExecuteDatagram(SBusDatagram):
             sbus_fd.SBUS_FD_LOGGER
         ]
 
-    def __init__(self, command, sfds, params=None, task_id=None):
+    def __init__(self, command, sfds, params=None, task_id=None,
+                 request_id=None):
         # TODO(kota_): the args command is not used in ExecuteDatagram
         #              but it could be worthful to taransparent init
         #              for other datagram classes.
@@ -207,19 +225,22 @@ class SBusExecuteDatagram(SBusDatagram):
         #                this implementation is based on the idea that
         #                we only have extra input sources, which is
         #                added at the end of fd list
-        extra_fdtypes = [sfd.fdtype for sfd in
-                         sfds[len(self._required_fdtypes):]]
+        num_required = len(self._required_fdtypes)
+        if request_id is not None:
+            num_required -= 1
+        extra_fdtypes = [sfd.fdtype for sfd in sfds[num_required:]]
 
         if [t for t in extra_fdtypes if t != sbus_fd.SBUS_FD_INPUT_OBJECT]:
             raise ValueError(
                 'Extra data should be SBUS_FD_INPUT_OBJECT')
 
         super(SBusExecuteDatagram, self).__init__(
-            sbus_cmd.SBUS_CMD_EXECUTE, sfds, params, task_id)
+            sbus_cmd.SBUS_CMD_EXECUTE, sfds, params, task_id, request_id)
 
     @property
     def invocation_fds(self):
-        return [sfd.fileno for sfd in self.sfds[1:]]
+        return [sfd.fileno for sfd in self.sfds
+                if sfd.fdtype != sbus_fd.SBUS_FD_SERVICE_OUT]
 
     @property
     def service_out_fd(self):
@@ -242,13 +263,13 @@ class SBusExecuteDatagram(SBusDatagram):
         return self._find_fds(sbus_fd.SBUS_FD_INPUT_OBJECT)
 
 
-def build_datagram(command, sfds, params, task_id):
+def build_datagram(command, sfds, params, task_id, request_id=None):
     if command == sbus_cmd.SBUS_CMD_EXECUTE:
         dtg_cls = SBusExecuteDatagram
     else:
         dtg_cls = SBusServiceDatagram
 
-    return dtg_cls(command, sfds, params, task_id)
+    return dtg_cls(command, sfds, params, task_id, request_id)
 
 
 def build_datagram_from_raw_message(fds, str_md, str_cmd_params):
@@ -260,15 +281,17 @@ def build_datagram_from_raw_message(fds, str_md, str_cmd_params):
     :param str_md: json serialized metadata dict
     :param str_cmd_params: json serialized command parameters dict
     """
-    metadata = json.loads(str_md)
+    # Metadata is omitted when no file descriptor is passed
+    metadata = json.loads(str_md) if str_md else []
     cmd_params = json.loads(str_cmd_params)
     command = cmd_params.get('command')
     params = cmd_params.get('params')
     task_id = cmd_params.get('task_id')
+    request_id = cmd_params.get('request_id')
 
     if len(fds) != len(metadata):
         raise ValueError('Length mismatch fds: %d != md %d' %
                          (len(fds), len(metadata)))
     sfds = [SBusFileDescriptor.from_fileno_and_metadata_dict(fileno, md)
             for (fileno, md) in zip(fds, metadata)]
-    return build_datagram(command, sfds, params, task_id)
+    return build_datagram(command, sfds, params, task_id, request_id)
@@ -0,0 +1,49 @@
+# Copyright (c) 2026 OpenStack Foundation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import struct
+
+# A response frame consists of the magic, the length of the payload in
+# network byte order and the payload itself. The magic never starts with '{'
+# so that it can be distinguished from bare json responses sent by old
+# servers. This should be kept consistent with SAbstractTask.java
+RESPONSE_FRAME_MAGIC = b'SBR1'
+_RESPONSE_FRAME_HEADER = struct.Struct('!4sI')
+RESPONSE_FRAME_HEADER_SIZE = _RESPONSE_FRAME_HEADER.size
+
+
+def pack_response_frame(payload):
+    """
+    Wrap response payload into a length-prefixed frame
+
+    :param payload: response bytes
+    :returns: framed bytes
+    """
+    return _RESPONSE_FRAME_HEADER.pack(RESPONSE_FRAME_MAGIC,
+                                       len(payload)) + payload
+
+
+def unpack_response_frame_header(buf):
+    """
+    Parse the header of a response frame
+
+    :param buf: buffer which contains at least RESPONSE_FRAME_HEADER_SIZE
+                bytes
+    :returns: length of the payload, or None if the buffer does not start
+              with a response frame header
+    """
+    magic, length = _RESPONSE_FRAME_HEADER.unpack_from(buf)
+    if magic != RESPONSE_FRAME_MAGIC:
+        return None
+    return length
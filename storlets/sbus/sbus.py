@@ -15,60 +15,81 @@
 
 from ctypes import c_char_p, c_int, c_float, CDLL, POINTER
 from storlets.sbus.datagram import build_datagram_from_raw_message
+from storlets.sbus.socket_sbus import SocketSBus
+
+DEFAULT_SBUS_BACKEND = 'native'
 
 
 class SBus(object):
     """
     Wrapper class for low level C-API for SBus functionality
 
+    The C library is loaded, and its function prototypes are declared, only
+    once per process. Every SBus instance shares the same library handle.
     """
     SBUS_SO_NAME = '/usr/local/lib/storlets/libsbus.so'
 
-    def __init__(self):
+    _sbus_back = None
+
+    @staticmethod
+    def _load_library():
+        """
+        Load the C-library and declare its function prototypes
+
+        :returns: the loaded library handle
+        """
+        if SBus._sbus_back is not None:
+            return SBus._sbus_back
+
         # load the C-library
-        self.sbus_back_ = CDLL(SBus.SBUS_SO_NAME)
+        sbus_back_ = CDLL(SBus.SBUS_SO_NAME)
 
         # create SBus
-        self.sbus_back_.sbus_create.argtypes = [c_char_p]
-        self.sbus_back_.sbus_create.restype = c_int
+        sbus_back_.sbus_create.argtypes = [c_char_p]
+        sbus_back_.sbus_create.restype = c_int
 
         # listen to SBus
-        self.sbus_back_.sbus_listen.argtypes = [c_int, c_float]
-        self.sbus_back_.sbus_listen.restype = c_int
+        sbus_back_.sbus_listen.argtypes = [c_int, c_float]
+        sbus_back_.sbus_listen.restype = c_int
 
         # send message
-        self.sbus_back_.sbus_send_msg.argtypes = [c_char_p,
-                                                  POINTER(c_int),
-                                                  c_int,
-                                                  c_char_p,
-                                                  c_int,
-                                                  c_char_p,
-                                                  c_int]
-        self.sbus_back_.sbus_send_msg.restype = c_int
+        sbus_back_.sbus_send_msg.argtypes = [c_char_p,
+                                             POINTER(c_int),
+                                             c_int,
+                                             c_char_p,
+                                             c_int,
+                                             c_char_p,
+                                             c_int]
+        sbus_back_.sbus_send_msg.restype = c_int
 
         # receive message
-        self.sbus_back_.sbus_recv_msg.argtypes = [c_int,
-                                                  POINTER(POINTER(c_int)),
-                                                  POINTER(c_int),
-                                                  POINTER(c_char_p),
-                                                  POINTER(c_int),
-                                                  POINTER(c_char_p),
-                                                  POINTER(c_int)]
-        self.sbus_back_.sbus_recv_msg.restype = c_int
+        sbus_back_.sbus_recv_msg.argtypes = [c_int,
+                                             POINTER(POINTER(c_int)),
+                                             POINTER(c_int),
+                                             POINTER(c_char_p),
+                                             POINTER(c_int),
+                                             POINTER(c_char_p),
+                                             POINTER(c_int)]
+        sbus_back_.sbus_recv_msg.restype = c_int
+
+        # logger
+        sbus_back_.sbus_start_logger.argtypes = [c_char_p, c_char_p]
+
+        SBus._sbus_back = sbus_back_
+        return sbus_back_
+
+    def __init__(self):
+        self.sbus_back_ = self._load_library()
 
     @staticmethod
     def start_logger(str_log_level='DEBUG', container_id=None):
-        # load the C-library
-        sbus_back_ = CDLL(SBus.SBUS_SO_NAME)
-
-        sbus_back_.sbus_start_logger.argtypes = [c_char_p, c_char_p]
+        sbus_back_ = SBus._load_library()
         sbus_back_.sbus_start_logger(str_log_level.encode("utf-8"),
                                      container_id.encode("utf-8"))
 
     @staticmethod
     def stop_logger():
-        # load the C-library
-        sbus_back_ = CDLL(SBus.SBUS_SO_NAME)
+        sbus_back_ = SBus._load_library()
         sbus_back_.sbus_stop_logger()
 
     def create(self, sbus_name):
@@ -147,8 +168,7 @@ class SBus(object):
                 h_files[i] = file_fds[i]
 
         # Invoke C function
-        sbus = SBus()
-        n_status = sbus.sbus_back_.sbus_send_msg(
+        n_status = SBus._load_library().sbus_send_msg(
             sbus_name.encode("utf-8"),
             h_files,
             n_files,
@@ -157,3 +177,25 @@ class SBus(object):
             p_params,
             n_params)
         return n_status
+
+
+SBUS_BACKENDS = {
+    'native': SBus,
+    'socket': SocketSBus,
+}
+
+
+def get_sbus_class(backend=None):
+    """
+    Get SBus implementation class for the given backend name
+
+    :param backend: 'native' to use libsbus via ctypes, or 'socket' to use
+                    the pure python implementation. Defaults to 'native'
+    :returns: SBus implementation class
+    :raises ValueError: when an unknown backend is given
+    """
+    backend = (backend or DEFAULT_SBUS_BACKEND).lower()
+    try:
+        return SBUS_BACKENDS[backend]
+    except KeyError:
+        raise ValueError('Unknown sbus backend %s' % backend)
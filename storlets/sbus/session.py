@@ -0,0 +1,114 @@
+# Copyright (c) 2026 OpenStack Foundation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Connection oriented sbus sessions
+
+In addition to the datagram socket, a server can listen on a SOCK_SEQPACKET
+socket placed next to it. A client keeps a connection to that socket and
+sends the same messages as over the datagram socket, with a request id
+instead of the service out fd. The server sends the response, tagged with
+the request id, back over the connection.
+"""
+import os
+import socket
+
+from storlets.sbus.socket_sbus import pack_message, unpack_message
+
+# This should be kept consistent with SBus.java
+SESSION_PATH_SUFFIX = '.session'
+SESSION_BACKLOG = 128
+MAX_RESPONSE_LENGTH = 65536
+
+
+def get_session_path(sbus_path):
+    """
+    Get the path of the session socket for the given sbus path
+
+    :param sbus_path: path to the datagram socket of the server
+    :returns: path to the session socket
+    """
+    return sbus_path + SESSION_PATH_SUFFIX
+
+
+def create_session_listener(sbus_path):
+    """
+    Create the socket listening for sessions
+
+    :param sbus_path: path to the datagram socket of the server
+    :returns: listening socket
+    :raises OSError: when failed to create the socket
+    """
+    session_path = get_session_path(sbus_path)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+    try:
+        try:
+            os.unlink(session_path)
+        except FileNotFoundError:
+            pass
+        sock.bind(session_path)
+        os.chmod(session_path, 0o777)
+        sock.listen(SESSION_BACKLOG)
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+def connect_session(sbus_path):
+    """
+    Connect to the session socket of the server
+
+    :param sbus_path: path to the datagram socket of the server
+    :returns: connected socket
+    :raises OSError: when failed to connect
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+    try:
+        sock.connect(get_session_path(sbus_path))
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+def send_response(sock, str_response):
+    """
+    Send a response over a session
+
+    The response is sent without blocking, so that a client which stops
+    reading the session can not stall the server.
+
+    :param sock: connected session socket
+    :param str_response: json serialized response, including the request id
+    :raises OSError: when failed to send the response, including when the
+                     socket buffer is full
+    """
+    sock.send(pack_message(0, '', str_response), socket.MSG_DONTWAIT)
+
+
+def receive_response(sock):
+    """
+    Receive a response from a session
+
+    :param sock: connected session socket
+    :returns: json serialized response, or None when the session is closed
+    :raises OSError: when failed to receive the response
+    :raises ValueError: when the response is malformed
+    """
+    msg = sock.recv(MAX_RESPONSE_LENGTH)
+    if not msg:
+        return None
+    n_files, str_metadata, str_response = unpack_message(msg)
+    return str_response
@@ -0,0 +1,194 @@
+# Copyright (c) 2026 OpenStack Foundation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import array
+import os
+import select
+import socket
+import struct
+
+from storlets.sbus.datagram import build_datagram_from_raw_message
+
+# These should be kept consistent with src/c/sbus/sbus.c
+MAX_FDS = 4096
+MAX_MSG_LENGTH = 4096
+
+# The message header consists of 3 native integers: number of files,
+# length of the files metadata and length of the command params
+_HEADER = struct.Struct('@3i')
+
+
+def pack_message(n_files, str_metadata, str_params):
+    """
+    Serialize a message into the byte stream used by libsbus
+
+    The layout is the same as dump_data_to_bytestream in sbus.c, that is,
+    3 integers followed by the metadata, the params and a terminating NULL.
+
+    :param n_files: number of file descriptors passed with the message
+    :param str_metadata: json serialized metadata
+    :param str_params: json serialized command params
+    :returns: bytes to be sent
+    """
+    b_metadata = str_metadata.encode('utf-8')
+    b_params = str_params.encode('utf-8')
+    return b''.join([_HEADER.pack(n_files, len(b_metadata), len(b_params)),
+                     b_metadata, b_params, b'\0'])
+
+
+def unpack_message(bytestream):
+    """
+    Deserialize the byte stream used by libsbus
+
+    :param bytestream: bytes received
+    :returns: a tuple of (number of files, metadata, params)
+    :raises ValueError: when the byte stream is malformed
+    """
+    if len(bytestream) < _HEADER.size:
+        raise ValueError('Message is too short')
+
+    n_files, n_metadata, n_params = _HEADER.unpack_from(bytestream)
+    offset = _HEADER.size
+    if n_files < 0 or n_metadata < 0 or n_params < 0 or \
+            offset + n_metadata + n_params > len(bytestream):
+        raise ValueError('Message is truncated')
+
+    str_metadata = bytestream[offset:offset + n_metadata].decode('utf-8')
+    offset += n_metadata
+    str_params = bytestream[offset:offset + n_params].decode('utf-8')
+    return n_files, str_metadata, str_params
+
+
+def send_message(sock, datagram, address=None):
+    """
+    Send a datagram over an AF_UNIX socket
+
+    :param sock: socket to send the message with
+    :param datagram: SBusDatagram instance
+    :param address: destination path, used only for unconnected sockets
+    :returns: the number of bytes sent
+    :raises OSError: when failed to send the message
+    """
+    fds = datagram.fds
+    if fds:
+        str_metadata = datagram.serialized_metadata
+    else:
+        str_metadata = ''
+    msg = pack_message(len(fds), str_metadata,
+                       datagram.serialized_cmd_params)
+    ancdata = [(socket.SOL_SOCKET, socket.SCM_RIGHTS,
+                array.array('i', fds))]
+    if address is None:
+        return sock.sendmsg([msg], ancdata)
+    return sock.sendmsg([msg], ancdata, 0, address)
+
+
+def receive_message(sock):
+    """
+    Receive a datagram from an AF_UNIX socket
+
+    :param sock: socket to receive the message from
+    :returns: SBusDatagram instance, or None when failed to receive a valid
+              message. Received file descriptors are closed in the latter
+              case.
+    """
+    int_size = array.array('i').itemsize
+    try:
+        msg, ancdata, flags, addr = sock.recvmsg(
+            MAX_MSG_LENGTH, socket.CMSG_SPACE(MAX_FDS * int_size))
+    except OSError:
+        return None
+
+    fds = array.array('i')
+    for cmsg_level, cmsg_type, cmsg_data in ancdata:
+        if cmsg_level == socket.SOL_SOCKET and \
+                cmsg_type == socket.SCM_RIGHTS:
+            fds.frombytes(
+                cmsg_data[:len(cmsg_data) - (len(cmsg_data) % int_size)])
+
+    try:
+        n_files, str_metadata, str_params = unpack_message(msg)
+        if n_files != len(fds):
+            raise ValueError('Incompatible number of descriptors')
+        return build_datagram_from_raw_message(
+            list(fds), str_metadata, str_params)
+    except ValueError:
+        for fd in fds:
+            os.close(fd)
+        return None
+
+
+class SocketSBus(object):
+    """
+    Pure python implementation of SBus functionality
+
+    This implements the same protocol as libsbus directly on AF_UNIX
+    datagram sockets, using SCM_RIGHTS to pass file descriptors. Because it
+    uses the socket module, sending is cooperative when eventlet
+    monkey-patching is enabled.
+    """
+
+    @staticmethod
+    def start_logger(str_log_level='DEBUG', container_id=None):
+        # Nothing to do because this backend has no native logger
+        pass
+
+    @staticmethod
+    def stop_logger():
+        pass
+
+    def create(self, sbus_name):
+        try:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        except OSError:
+            return -1
+
+        try:
+            try:
+                os.unlink(sbus_name)
+            except FileNotFoundError:
+                pass
+            sock.bind(sbus_name)
+            os.chmod(sbus_name, 0o777)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        except OSError:
+            sock.close()
+            return -1
+
+        return sock.detach()
+
+    def listen(self, sbus_handler, timeout=0.0):
+        try:
+            r, w, e = select.select([sbus_handler], [], [],
+                                    timeout if timeout > 0 else None)
+        except (OSError, ValueError):
+            return -1
+        return 1 if sbus_handler in r else 0
+
+    def receive(self, sbus_handler):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM,
+                             fileno=sbus_handler)
+        try:
+            return receive_message(sock)
+        finally:
+            # The handler is owned by the caller
+            sock.detach()
+
+    @staticmethod
+    def send(sbus_name, datagram):
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sock:
+                return send_message(sock, datagram, sbus_name)
+        except OSError:
+            return -1
@@ -12,16 +12,24 @@
 # implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import io
 import json
+import os
+import threading
 import unittest
 from unittest import mock
 
 from storlets.sbus import command as sbus_cmd
 from storlets.sbus.file_description import SBUS_FD_SERVICE_OUT
 from storlets.sbus.datagram import SBusFileDescriptor, SBusServiceDatagram
+from storlets.sbus.response import RESPONSE_FRAME_HEADER_SIZE, \
+    unpack_response_frame_header
 from storlets.agent.common.server import EXIT_SUCCESS, command_handler, \
     CommandResponse, CommandFailure, CommandSuccess, SBusServer
-from tests.unit import FakeLogger
+from storlets.sbus import SocketSBus
+from storlets.sbus.client import SBusClient
+from storlets.sbus.session import get_session_path
+from tests.unit import FakeLogger, with_tempdir
 
 
 class TestCommandResponse(unittest.TestCase):
@@ -53,6 +61,16 @@ class TestCommandResponse(unittest.TestCase):
         self.assertEqual({'status': True, 'message': 'msg', 'task_id': 'foo'},
                          json.loads(resp.report_message))
 
+    def test_session_message(self):
+        resp = CommandResponse(True, 'msg', True)
+        self.assertEqual({'status': True, 'message': 'msg', 'request_id': 1},
+                         json.loads(resp.session_message(1)))
+
+        resp = CommandResponse(False, 'msg', True, 'foo')
+        self.assertEqual({'status': False, 'message': 'msg',
+                          'task_id': 'foo', 'request_id': 2},
+                         json.loads(resp.session_message(2)))
+
 
 class TestCommandSuccess(unittest.TestCase):
     def test_init(self):
@@ -107,6 +125,16 @@ class TestSBusServer(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.server.get_handler('SBUS_CMD_UNKNOWN')
 
+    def test_respond(self):
+        outfile = io.BytesIO()
+        self.server._respond(outfile, CommandSuccess('OK', task_id='foo'))
+        data = outfile.getvalue()
+        length = unpack_response_frame_header(data)
+        self.assertEqual(len(data) - RESPONSE_FRAME_HEADER_SIZE, length)
+        self.assertEqual(
+            {'status': True, 'message': 'OK', 'task_id': 'foo'},
+            json.loads(data[RESPONSE_FRAME_HEADER_SIZE:]))
+
 
 def create_fake_sbus_class(scenario):
     """
@@ -199,5 +227,54 @@ class TestSBusServerMain(unittest.TestCase):
         self.assertEqual(EXIT_SUCCESS, ret)
 
 
+class _HaltableSBusServer(SBusServer):
+    @command_handler
+    def halt(self, dtg):
+        return CommandSuccess('OK', False)
+
+    def _terminate(self):
+        pass
+
+
+class TestSBusServerSession(unittest.TestCase):
+    def setUp(self):
+        self.logger = FakeLogger()
+
+    @with_tempdir
+    def test_main_loop_with_session(self, tempdir):
+        sbus_path = os.path.join(tempdir, 'sbus')
+        server = _HaltableSBusServer(sbus_path, self.logger,
+                                     enable_session=True)
+        results = []
+
+        def run_client():
+            # Wait until the server gets ready
+            for _ in range(100):
+                if os.path.exists(get_session_path(sbus_path)):
+                    break
+                threading.Event().wait(0.05)
+            session_client = SBusClient(sbus_path, sbus_backend='socket',
+                                        use_session=True)
+            datagram_client = SBusClient(sbus_path, sbus_backend='socket')
+            results.append(session_client.ping())
+            results.append(datagram_client.ping())
+            results.append(session_client.ping())
+            results.append(session_client.halt())
+
+        client = threading.Thread(target=run_client)
+        client.start()
+        with mock.patch('storlets.agent.common.server.SBus', SocketSBus):
+            ret = server.main_loop()
+        client.join()
+
+        self.assertEqual(EXIT_SUCCESS, ret)
+        self.assertEqual([True] * 4, [resp.status for resp in results])
+        self.assertEqual([], self.logger.get_log_lines('error'))
+        # The session socket is removed on exit
+        self.assertFalse(os.path.exists(get_session_path(sbus_path)))
+        self.assertEqual({}, server.sessions)
+        self.assertIsNone(server.session_listener)
+
+
 if __name__ == '__main__':
     unittest.main()
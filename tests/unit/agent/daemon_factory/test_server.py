@@ -85,6 +85,30 @@ class TestStorletDaemonFactory(unittest.TestCase):
                  '/usr/local/lib/storlets/java'],
                 env['LD_LIBRARY_PATH'].split(':'))
 
+    def test_get_args_enable_session(self):
+        self.dfactory = StorletDaemonFactory(self.pipe_path, self.logger,
+                                             self.container_id,
+                                             enable_session=True)
+        pargs, _ = self.dfactory.get_jvm_args(
+            'java', 'path/to/storlet/a', 'Storlet-1.0.jar',
+            1, 'path/to/uds/a', 'DEBUG')
+        self.assertEqual(
+            ['/usr/bin/java', 'org.openstack.storlet.daemon.SDaemon',
+             'Storlet-1.0.jar', 'path/to/uds/a', 'DEBUG', '1',
+             self.container_id, '--enable-session'],
+            pargs)
+
+        pargs, _ = self.dfactory.get_python_args(
+            'python', 'path/to/storlet', 'test_storlet.TestStorlet',
+            1, 'path/to/uds', 'DEBUG', None)
+        self.assertEqual(
+            ['/usr/bin/python3',
+             '/usr/local/libexec/storlets/storlets-daemon',
+             'test_storlet.TestStorlet',
+             'path/to/uds', 'DEBUG', '1', self.container_id,
+             '--enable-session'],
+            pargs)
+
     def test_get_python_args(self):
         self._test_get_python_args(None, '3')
         self._test_get_python_args('3.10', '3.10')
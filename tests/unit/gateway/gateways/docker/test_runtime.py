@@ -84,6 +84,18 @@ class TestDockerRunTimeSandbox(unittest.TestCase):
 
         # TODO(takashi): should test timeout case
 
+    def test_get_container_command(self):
+        self.assertEqual(
+            ['/mnt/channels/factory_pipe', 'DEBUG', 'storlet_container'],
+            self.sbox._get_container_command('storlet_container'))
+
+        self.conf['sbus_session'] = 'true'
+        sbox = DockerRunTimeSandbox(self.scope, self.conf, self.logger)
+        self.assertEqual(
+            ['/mnt/channels/factory_pipe', 'DEBUG', 'storlet_container',
+             '--enable-session'],
+            sbox._get_container_command('storlet_container'))
+
     def test__restart(self):
         # storlet container is not running
         with mock.patch('storlets.gateway.gateways.docker.runtime.'
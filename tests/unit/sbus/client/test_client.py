@@ -20,14 +20,16 @@ import os
 import unittest
 from unittest import mock
 
-from storlets.sbus.client.exceptions import SBusClientSendError, \
-    SBusClientMalformedResponse
+from storlets.sbus.client.exceptions import SBusClientIOError, \
+    SBusClientSendError, SBusClientMalformedResponse
 from storlets.sbus.client import SBusClient
+from storlets.sbus import SBus, SocketSBus
+from storlets.sbus.response import pack_response_frame
 
 
 @contextmanager
 def _mock_sbus(send_status=0):
-    with mock.patch('storlets.sbus.client.client.SBus.send') as fake_send:
+    with mock.patch('storlets.sbus.sbus.SBus.send') as fake_send:
         fake_send.return_value = send_status
         yield
 
@@ -39,19 +41,22 @@ def _mock_os_pipe(bufs):
             self.rbuf = rbuf
             self.closed = False
 
-        def read(self, size):
-            size = min(len(self.rbuf), size)
-            ret = self.rbuf[:size]
-            self.rbuf = self.rbuf[size:]
-            return ret
+        def readv(self, buffers):
+            total = 0
+            for buf in buffers:
+                size = min(len(self.rbuf), len(buf))
+                buf[:size] = self.rbuf[:size]
+                self.rbuf = self.rbuf[size:]
+                total += size
+            return total
 
         def close(self):
             if self.closed:
                 raise OSError(errno.EBADF, os.strerror(errno.EBADF))
             self.closed = True
 
-    def fake_os_read(fd, size):
-        return fd.read(size)
+    def fake_os_readv(fd, buffers):
+        return fd.readv(buffers)
 
     def fake_os_close(fd):
         fd.close()
@@ -66,7 +71,8 @@ def _mock_os_pipe(bufs):
             raise AssertionError('pipe called more than expected')
 
     with mock.patch('storlets.sbus.client.client.os.pipe', mock_os_pipe), \
-            mock.patch('storlets.sbus.client.client.os.read', fake_os_read), \
+            mock.patch('storlets.sbus.client.client.os.readv',
+                       fake_os_readv), \
             mock.patch('storlets.sbus.client.client.os.close', fake_os_close):
         yield pipes
 
@@ -76,6 +82,13 @@ class TestSBusClient(unittest.TestCase):
         self.pipe_path = 'pipe_path'
         self.client = SBusClient(self.pipe_path, 4)
 
+    def test_init_sbus_backend(self):
+        self.assertIs(SBus, self.client.sbus)
+        client = SBusClient(self.pipe_path, sbus_backend='socket')
+        self.assertIs(SocketSBus, client.sbus)
+        with self.assertRaises(ValueError):
+            SBusClient(self.pipe_path, sbus_backend='unknown')
+
     def test_parse_response(self):
         raw_resp = json.dumps({'status': True, 'message': 'OK'})
         resp = self.client._parse_response(raw_resp)
@@ -113,6 +126,79 @@ class TestSBusClient(unittest.TestCase):
         with self.assertRaises(SBusClientMalformedResponse):
             self.client._parse_response(raw_resp)
 
+    def test_read_response_framed(self):
+        payload = json.dumps(
+            {'status': True, 'message': 'OK'}).encode('utf-8')
+        # The response is larger than the initial buffer size
+        with _mock_os_pipe([pack_response_frame(payload) + b'trailing']) \
+                as pipes:
+            self.assertEqual(payload,
+                             self.client._read_response(pipes[0][0]))
+            # Reading should stop at the end of the frame
+            self.assertEqual(b'trailing', pipes[0][0].rbuf)
+
+        client = SBusClient(self.pipe_path)
+        with _mock_os_pipe([pack_response_frame(payload)]) as pipes:
+            self.assertEqual(payload, client._read_response(pipes[0][0]))
+
+        with _mock_os_pipe([pack_response_frame(b'')]) as pipes:
+            self.assertEqual(b'', client._read_response(pipes[0][0]))
+
+    def test_read_response_truncated(self):
+        with _mock_os_pipe([pack_response_frame(b'{"status": true}')[:-1]]) \
+                as pipes:
+            with self.assertRaises(SBusClientMalformedResponse):
+                self.client._read_response(pipes[0][0])
+
+    def test_read_response_legacy(self):
+        payload = json.dumps(
+            {'status': True, 'message': 'OK'}).encode('utf-8')
+        for resp in (payload, b'Foo', b''):
+            with _mock_os_pipe([resp]) as pipes:
+                self.assertEqual(resp,
+                                 self.client._read_response(pipes[0][0]))
+                self.assertEqual(b'', pipes[0][0].rbuf)
+
+    def test_read_response_io_error(self):
+        with _mock_os_pipe([b'']) as pipes:
+            with mock.patch('storlets.sbus.client.client.os.readv',
+                            side_effect=OSError):
+                with self.assertRaises(SBusClientIOError):
+                    self.client._read_response(pipes[0][0])
+
+    def test_request_over_session(self):
+        client = SBusClient(self.pipe_path, use_session=True)
+        session = mock.MagicMock()
+        session.next_request_id.return_value = 7
+        session.request.return_value = json.dumps(
+            {'status': True, 'message': 'OK', 'task_id': 'foo',
+             'request_id': 7})
+        with mock.patch('storlets.sbus.client.client.get_session',
+                        return_value=session) as fake_get_session, \
+                mock.patch('storlets.sbus.client.client.os.pipe') as \
+                fake_pipe:
+            resp = client.daemon_status('storleta')
+        fake_get_session.assert_called_once_with(self.pipe_path)
+        fake_pipe.assert_not_called()
+        self.assertTrue(resp.status)
+        self.assertEqual('OK', resp.message)
+        self.assertEqual('foo', resp.task_id)
+        dtg = session.request.call_args[0][0]
+        self.assertEqual(7, dtg.request_id)
+        self.assertEqual({'storlet_name': 'storleta'}, dtg.params)
+        self.assertEqual([], dtg.fds)
+
+    def test_request_session_not_supported(self):
+        client = SBusClient(self.pipe_path, use_session=True)
+        raw_resp = json.dumps(
+            {'status': True, 'message': 'OK'}).encode("utf-8")
+        with mock.patch('storlets.sbus.client.client.get_session',
+                        return_value=None), \
+                _mock_os_pipe([raw_resp]) as pipes, _mock_sbus(0):
+            resp = client.ping()
+            self.assertTrue(resp.status)
+            self._check_all_pipes_closed(pipes)
+
     def _check_all_pipes_closed(self, pipes):
         # Make sure that pipes are not empty
         self.assertGreater(len(pipes), 0)
@@ -145,6 +231,14 @@ class TestSBusClient(unittest.TestCase):
                 method(*args, **kwargs)
             self._check_all_pipes_closed(pipes)
 
+        raw_resp = pack_response_frame(json.dumps(
+            {'status': True, 'message': 'OK'}).encode("utf-8"))
+        with _mock_os_pipe([raw_resp]) as pipes, _mock_sbus(0):
+            resp = method(*args, **kwargs)
+            self.assertTrue(resp.status)
+            self.assertEqual('OK', resp.message)
+            self._check_all_pipes_closed(pipes)
+
         # TODO(takashi): Add IOError case
 
         with _mock_os_pipe([b'Foo']) as pipes, _mock_sbus(0):
@@ -0,0 +1,178 @@
+# Copyright (c) 2026 OpenStack Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import socket
+import threading
+import unittest
+from unittest import mock
+
+from storlets.sbus.command import SBUS_CMD_PING
+from storlets.sbus.datagram import build_datagram
+from storlets.sbus.session import create_session_listener, send_response
+from storlets.sbus.socket_sbus import receive_message
+from storlets.sbus.client import session as sbus_session
+from storlets.sbus.client.exceptions import SBusClientIOError, \
+    SBusClientSendError
+from storlets.sbus.client.session import SBusSession, get_session
+from tests.unit import with_tempdir
+
+
+def _response(request_id, message='OK'):
+    return json.dumps({'status': True, 'message': message,
+                       'request_id': request_id})
+
+
+class TestSBusSession(unittest.TestCase):
+    def setUp(self):
+        self.client_sock, self.server_sock = socket.socketpair(
+            socket.AF_UNIX, socket.SOCK_SEQPACKET)
+        self.session = SBusSession('path/to/sbus', self.client_sock)
+
+    def tearDown(self):
+        self.session.close()
+        self.server_sock.close()
+
+    def _datagram(self):
+        return build_datagram(SBUS_CMD_PING, [], None, None,
+                              self.session.next_request_id())
+
+    def test_request(self):
+        def serve():
+            dtg = receive_message(self.server_sock)
+            send_response(self.server_sock, _response(dtg.request_id))
+
+        server = threading.Thread(target=serve)
+        server.start()
+        dtg = self._datagram()
+        self.assertEqual(_response(dtg.request_id),
+                         self.session.request(dtg))
+        server.join()
+        self.assertTrue(self.session.is_alive())
+
+    def test_request_multiplexed(self):
+        dtgs = [self._datagram() for _ in range(3)]
+        results = {}
+
+        def request(dtg):
+            results[dtg.request_id] = self.session.request(dtg)
+
+        clients = [threading.Thread(target=request, args=(dtg,))
+                   for dtg in dtgs]
+        for client in clients:
+            client.start()
+
+        request_ids = [receive_message(self.server_sock).request_id
+                       for _ in dtgs]
+        # Respond in the reverse order
+        for request_id in reversed(sorted(request_ids)):
+            send_response(self.server_sock,
+                          _response(request_id, 'OK%d' % request_id))
+        for client in clients:
+            client.join()
+
+        self.assertEqual(
+            dict((dtg.request_id, _response(dtg.request_id,
+                                            'OK%d' % dtg.request_id))
+                 for dtg in dtgs),
+            results)
+
+    def test_request_session_closed_by_server(self):
+        self.server_sock.close()
+        with self.assertRaises((SBusClientIOError, SBusClientSendError)):
+            self.session.request(self._datagram())
+        self.assertTrue(self.session.closed)
+        self.assertFalse(self.session.is_alive())
+
+        with self.assertRaises(SBusClientSendError):
+            self.session.request(self._datagram())
+
+    def test_is_alive(self):
+        self.assertTrue(self.session.is_alive())
+        self.server_sock.close()
+        self.assertFalse(self.session.is_alive())
+        self.assertTrue(self.session.closed)
+
+    def test_is_alive_discards_late_responses(self):
+        # Responses to requests given up by their callers
+        send_response(self.server_sock, _response(1))
+        send_response(self.server_sock, _response(2))
+        self.assertTrue(self.session.is_alive())
+        self.assertFalse(self.session.closed)
+
+        dtg = self._datagram()
+        send_response(self.server_sock, _response(dtg.request_id))
+        self.assertEqual(_response(dtg.request_id),
+                         self.session.request(dtg))
+
+
+class TestGetSession(unittest.TestCase):
+    def setUp(self):
+        self.sessions = {}
+        self.unsupported = {}
+        for name, value in (('_sessions', self.sessions),
+                            ('_unsupported', self.unsupported)):
+            patcher = mock.patch.object(sbus_session, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    @with_tempdir
+    def test_get_session_not_supported(self, tempdir):
+        sbus_path = os.path.join(tempdir, 'sbus')
+        with mock.patch('storlets.sbus.client.session.time.time',
+                        return_value=1000):
+            self.assertIsNone(get_session(sbus_path))
+        self.assertEqual({sbus_path: 1000 + sbus_session.UNSUPPORTED_TTL},
+                         self.unsupported)
+
+        with create_session_listener(sbus_path) as listener:
+            # The failure is remembered until the ttl expires
+            with mock.patch('storlets.sbus.client.session.connect_session') \
+                    as connect, \
+                    mock.patch('storlets.sbus.client.session.time.time',
+                               return_value=1059):
+                self.assertIsNone(get_session(sbus_path))
+            connect.assert_not_called()
+
+            with mock.patch('storlets.sbus.client.session.time.time',
+                            return_value=1060):
+                session = get_session(sbus_path)
+            self.assertIsNotNone(session)
+            self.assertEqual({}, self.unsupported)
+            session.close()
+            listener.accept()[0].close()
+
+    @with_tempdir
+    def test_get_session(self, tempdir):
+        sbus_path = os.path.join(tempdir, 'sbus')
+        with create_session_listener(sbus_path) as listener:
+            session = get_session(sbus_path)
+            self.assertIsNotNone(session)
+            server, _ = listener.accept()
+            # The session is reused
+            self.assertIs(session, get_session(sbus_path))
+
+            # Reconnect when the session is closed by the server
+            server.close()
+            new_session = get_session(sbus_path)
+            self.assertIsNot(session, new_session)
+            self.assertTrue(session.closed)
+            new_session.close()
+            listener.accept()[0].close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -151,6 +151,18 @@ class TestSBusServiceDatagram(SBusDatagramTestMixin, unittest.TestCase):
     def test_service_out_fd(self):
         self.assertEqual(1, self.dtg.service_out_fd)
 
+    def test_init_with_request_id(self):
+        # service out fd is not required for requests sent over a session
+        dtg = self._test_class(self.command, [], self.params,
+                               self.task_id, 3)
+        self.assertEqual(3, dtg.request_id)
+        self.assertIsNone(dtg.service_out_fd)
+        self.assertEqual({'command': self.command,
+                          'params': self.params,
+                          'task_id': self.task_id,
+                          'request_id': 3},
+                         dtg.cmd_params)
+
 
 class TestSBusExecuteDatagram(SBusDatagramTestMixin, unittest.TestCase):
     _test_class = SBusExecuteDatagram
@@ -194,6 +206,20 @@ class TestSBusExecuteDatagram(SBusDatagramTestMixin, unittest.TestCase):
     def test_invocation_fds(self):
         self.assertEqual([2, 3, 4, 5], self.dtg.invocation_fds)
 
+    def test_init_with_request_id(self):
+        sfds = self.sfds[1:] + [
+            SBusFileDescriptor(sbus_fd.SBUS_FD_INPUT_OBJECT, 6)]
+        dtg = self._test_class(self.command, sfds, self.params,
+                               self.task_id, 3)
+        self.assertEqual(3, dtg.request_id)
+        self.assertIsNone(dtg.service_out_fd)
+        self.assertEqual([2, 3, 4, 5, 6], dtg.invocation_fds)
+        self.assertEqual([2, 6], dtg.object_in_fds)
+
+        with self.assertRaises(ValueError):
+            self._test_class(self.command, self.sfds, self.params,
+                             self.task_id, 3)
+
     def test_object_out_fds(self):
         self.assertEqual([3], self.dtg.object_out_fds)
 
@@ -307,6 +333,14 @@ class TestBuildDatagram(unittest.TestCase):
         self.assertEqual(params, dtg.params)
         self.assertEqual(task_id, dtg.task_id)
 
+    def test_build_datagram_from_raw_message_with_request_id(self):
+        cmd_params = {'command': SBUS_CMD_PING, 'request_id': 5}
+        dtg = build_datagram_from_raw_message([], '[]',
+                                              json.dumps(cmd_params))
+        self.assertIsInstance(dtg, SBusServiceDatagram)
+        self.assertEqual(5, dtg.request_id)
+        self.assertIsNone(dtg.service_out_fd)
+
 
 if __name__ == '__main__':
     unittest.main()
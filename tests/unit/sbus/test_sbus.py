@@ -0,0 +1,60 @@
+# Copyright (c) 2026 OpenStack Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from unittest import mock
+
+from storlets.sbus import SBus, SocketSBus, get_sbus_class
+
+
+class TestSBus(unittest.TestCase):
+    def setUp(self):
+        SBus._sbus_back = None
+
+    def tearDown(self):
+        SBus._sbus_back = None
+
+    def test_library_loaded_once(self):
+        with mock.patch('storlets.sbus.sbus.CDLL') as cdll:
+            sbus1 = SBus()
+            sbus2 = SBus()
+            SBus.start_logger('DEBUG', 'cid')
+            SBus.stop_logger()
+        cdll.assert_called_once_with(SBus.SBUS_SO_NAME)
+        self.assertIs(sbus1.sbus_back_, sbus2.sbus_back_)
+        self.assertIs(cdll.return_value, sbus1.sbus_back_)
+
+    def test_send_uses_cached_library(self):
+        dtg = mock.MagicMock(num_fds=0, serialized_cmd_params='{}')
+        with mock.patch('storlets.sbus.sbus.CDLL') as cdll:
+            cdll.return_value.sbus_send_msg.return_value = 10
+            self.assertEqual(10, SBus.send('path', dtg))
+            self.assertEqual(10, SBus.send('path', dtg))
+        cdll.assert_called_once_with(SBus.SBUS_SO_NAME)
+        self.assertEqual(2, cdll.return_value.sbus_send_msg.call_count)
+
+
+class TestGetSBusClass(unittest.TestCase):
+    def test_get_sbus_class(self):
+        self.assertIs(SBus, get_sbus_class())
+        self.assertIs(SBus, get_sbus_class('native'))
+        self.assertIs(SocketSBus, get_sbus_class('socket'))
+        self.assertIs(SocketSBus, get_sbus_class('Socket'))
+        with self.assertRaises(ValueError):
+            get_sbus_class('unknown')
+
+
+if __name__ == '__main__':
+    unittest.main()
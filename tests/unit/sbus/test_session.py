@@ -0,0 +1,78 @@
+# Copyright (c) 2026 OpenStack Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import stat
+import unittest
+
+from storlets.sbus.command import SBUS_CMD_PING
+from storlets.sbus.datagram import build_datagram
+from storlets.sbus.session import connect_session, \
+    create_session_listener, get_session_path, receive_response, \
+    send_response
+from storlets.sbus.socket_sbus import receive_message, send_message
+from tests.unit import with_tempdir
+
+
+class TestSession(unittest.TestCase):
+    def test_get_session_path(self):
+        self.assertEqual('/path/to/sbus.session',
+                         get_session_path('/path/to/sbus'))
+
+    @with_tempdir
+    def test_create_session_listener(self, tempdir):
+        sbus_path = os.path.join(tempdir, 'sbus')
+        with create_session_listener(sbus_path):
+            mode = os.stat(get_session_path(sbus_path)).st_mode
+            self.assertTrue(stat.S_ISSOCK(mode))
+            self.assertEqual(0o777, stat.S_IMODE(mode))
+
+    @with_tempdir
+    def test_create_session_listener_failure(self, tempdir):
+        sbus_path = os.path.join(tempdir, 'notexist', 'sbus')
+        with self.assertRaises(OSError):
+            create_session_listener(sbus_path)
+
+    @with_tempdir
+    def test_connect_session_failure(self, tempdir):
+        with self.assertRaises(OSError):
+            connect_session(os.path.join(tempdir, 'sbus'))
+
+    @with_tempdir
+    def test_request_and_response(self, tempdir):
+        sbus_path = os.path.join(tempdir, 'sbus')
+        with create_session_listener(sbus_path) as listener, \
+                connect_session(sbus_path) as client:
+            server, _ = listener.accept()
+            with server:
+                dtg = build_datagram(SBUS_CMD_PING, [], None, None, 1)
+                send_message(client, dtg)
+                received = receive_message(server)
+                self.assertEqual(SBUS_CMD_PING, received.command)
+                self.assertEqual(1, received.request_id)
+                self.assertEqual(0, received.num_fds)
+
+                str_response = json.dumps({'status': True, 'message': 'OK',
+                                           'request_id': 1})
+                send_response(server, str_response)
+                self.assertEqual(str_response, receive_response(client))
+
+            # The session is closed by the server
+            self.assertIsNone(receive_response(client))
+
+
+if __name__ == '__main__':
+    unittest.main()
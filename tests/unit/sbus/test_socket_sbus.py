@@ -0,0 +1,116 @@
+# Copyright (c) 2026 OpenStack Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import stat
+import struct
+import unittest
+
+import storlets.sbus.file_description as sbus_fd
+from storlets.sbus.command import SBUS_CMD_PING
+from storlets.sbus.datagram import SBusFileDescriptor, SBusServiceDatagram
+from storlets.sbus.socket_sbus import SocketSBus, pack_message, \
+    unpack_message
+from tests.unit import with_tempdir
+
+
+class TestMessageFormat(unittest.TestCase):
+    def test_pack_message(self):
+        # Same layout as dump_data_to_bytestream in sbus.c
+        expected = struct.pack('@3i', 2, 4, 6) + b'[{}]' + b'{"a":1' + b'\0'
+        self.assertEqual(expected, pack_message(2, '[{}]', '{"a":1'))
+
+    def test_unpack_message(self):
+        self.assertEqual(
+            (1, '[{}]', '{"a": 1}'),
+            unpack_message(pack_message(1, '[{}]', '{"a": 1}')))
+        self.assertEqual(
+            (0, '', '{}'),
+            unpack_message(pack_message(0, '', '{}')))
+
+    def test_unpack_message_malformed(self):
+        with self.assertRaises(ValueError):
+            unpack_message(b'\0')
+        with self.assertRaises(ValueError):
+            unpack_message(struct.pack('@3i', 0, 10, 10) + b'{}')
+
+
+class TestSocketSBus(unittest.TestCase):
+    def _build_datagram(self, fileno):
+        sfds = [SBusFileDescriptor(sbus_fd.SBUS_FD_SERVICE_OUT, fileno)]
+        return SBusServiceDatagram(SBUS_CMD_PING, sfds,
+                                   params={'foo': 'bar'}, task_id='tid')
+
+    @with_tempdir
+    def test_create(self, tempdir):
+        sbus_path = os.path.join(tempdir, 'sbus')
+        sbus = SocketSBus()
+        fd = sbus.create(sbus_path)
+        try:
+            self.assertGreaterEqual(fd, 0)
+            mode = os.stat(sbus_path).st_mode
+            self.assertTrue(stat.S_ISSOCK(mode))
+            self.assertEqual(0o777, stat.S_IMODE(mode))
+        finally:
+            os.close(fd)
+
+    @with_tempdir
+    def test_create_failure(self, tempdir):
+        sbus_path = os.path.join(tempdir, 'notexist', 'sbus')
+        self.assertEqual(-1, SocketSBus().create(sbus_path))
+
+    @with_tempdir
+    def test_send_and_receive(self, tempdir):
+        sbus_path = os.path.join(tempdir, 'sbus')
+        sbus = SocketSBus()
+        fd = sbus.create(sbus_path)
+        read_fd, write_fd = os.pipe()
+        try:
+            # nothing is sent yet
+            self.assertEqual(0, sbus.listen(fd, 0.01))
+
+            dtg = self._build_datagram(write_fd)
+            self.assertGreater(SocketSBus.send(sbus_path, dtg), 0)
+            os.close(write_fd)
+
+            self.assertEqual(1, sbus.listen(fd, 1))
+            received = sbus.receive(fd)
+            self.assertEqual(SBUS_CMD_PING, received.command)
+            self.assertEqual({'foo': 'bar'}, received.params)
+            self.assertEqual('tid', received.task_id)
+            self.assertEqual(1, received.num_fds)
+
+            # The received fd should be a duplicate of the write fd
+            with os.fdopen(received.service_out_fd, 'wb') as f:
+                f.write(b'response')
+            self.assertEqual(b'response', os.read(read_fd, 1024))
+        finally:
+            os.close(read_fd)
+            os.close(fd)
+
+    @with_tempdir
+    def test_send_failure(self, tempdir):
+        sbus_path = os.path.join(tempdir, 'sbus')
+        read_fd, write_fd = os.pipe()
+        try:
+            self.assertEqual(-1, SocketSBus.send(
+                sbus_path, self._build_datagram(write_fd)))
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+# Copyright (c) 2026 OpenStack Foundation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Microbenchmark for reading sbus command responses
+
+This compares the number of read system calls and the time needed to read
+a command response from the service out pipe, between the legacy reader
+(16 bytes reads until EOF) and SBusClient._read_response with framed
+responses.
+
+Usage: python tools/sbus_response_benchmark.py [--count N] [--size BYTES]
+"""
+import argparse
+import json
+import os
+import time
+from unittest import mock
+
+from storlets.sbus.client.client import SBusClient
+from storlets.sbus.response import pack_response_frame
+
+
+def legacy_read_response(read_fd, chunk_size=16):
+    reply = b''
+    while True:
+        buf = os.read(read_fd, chunk_size)
+        if not buf:
+            break
+        reply = reply + buf
+    return reply
+
+
+def framed_read_response(read_fd):
+    return SBusClient('unused')._read_response(read_fd)
+
+
+def run(reader, response, count):
+    calls = [0]
+    orig_read = os.read
+    orig_readv = os.readv
+
+    def counted_read(fd, size):
+        calls[0] += 1
+        return orig_read(fd, size)
+
+    def counted_readv(fd, buffers):
+        calls[0] += 1
+        return orig_readv(fd, buffers)
+
+    elapsed = 0.0
+    with mock.patch('os.read', counted_read), \
+            mock.patch('os.readv', counted_readv):
+        for _ in range(count):
+            read_fd, write_fd = os.pipe()
+            # Same as SBusServer, the response is written at once and the
+            # pipe is closed after that
+            os.write(write_fd, response)
+            os.close(write_fd)
+            start = time.perf_counter()
+            reader(read_fd)
+            elapsed += time.perf_counter() - start
+            os.close(read_fd)
+    return calls[0] / count, elapsed / count * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark reading sbus command responses')
+    parser.add_argument('--count', type=int, default=10000,
+                        help='number of responses to read')
+    parser.add_argument('--size', type=int, default=0,
+                        help='extra bytes added to the response message')
+    opts = parser.parse_args()
+
+    payload = json.dumps({'status': True,
+                          'message': 'OK' + 'x' * opts.size,
+                          'task_id': 'a1b2c3d4'}).encode('utf-8')
+
+    print('response payload: %d bytes' % len(payload))
+    for name, reader, response in (
+            ('legacy', legacy_read_response, payload),
+            ('framed', framed_read_response, pack_response_frame(payload))):
+        syscalls, usec = run(reader, response, opts.count)
+        print('%-8s read syscalls/command: %6.1f  usec/command: %8.2f' %
+              (name, syscalls, usec))
+
+
+if __name__ == '__main__':
+    main()